@@ -0,0 +1,66 @@
+"""
+Fixtures shared by the widget tests, which run on the offscreen platform.
+
+@author: Eddie
+"""
+
+import os
+from typing import List
+
+import pytest
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from PyQt5 import QtWidgets, QtCore, QtGui  # noqa: E402
+from PyQt5.QtTest import QTest  # noqa: E402
+
+
+class _PaintRecorder(QtCore.QObject):
+    """Record the region of every paint event of a widget."""
+
+    def __init__(self, widget: QtWidgets.QWidget):
+        super(_PaintRecorder, self).__init__(widget)
+        self.regions: List[QtGui.QRegion] = []
+        widget.installEventFilter(self)
+
+    def eventFilter(self, obj: QtCore.QObject, event: QtCore.QEvent) -> bool:
+        if event.type() == QtCore.QEvent.Paint:
+            self.regions.append(QtGui.QRegion(event.region()))
+        return False
+
+    def painted(self) -> QtCore.QRect:
+        """Get the bounding rect of all the regions painted so far."""
+        rect = QtCore.QRect()
+        for region in self.regions:
+            rect = rect.united(region.boundingRect())
+        return rect
+
+
+@pytest.fixture(scope='session')
+def qapp() -> QtWidgets.QApplication:
+    """Get the application, creating it for the first test."""
+    app = QtWidgets.QApplication.instance()
+    if app is None:
+        app = QtWidgets.QApplication([])
+    return app
+
+
+@pytest.fixture
+def shown(qapp):
+    """Show a widget, wait for it to be painted, and record its paints."""
+    widgets = []
+
+    def show(widget: QtWidgets.QWidget) -> _PaintRecorder:
+        widgets.append(widget)
+        widget.show()
+        QTest.qWaitForWindowExposed(widget)
+        QtWidgets.QApplication.processEvents()
+        return _PaintRecorder(widget)
+
+    yield show
+
+    for widget in widgets:
+        widget.close()
+        widget.deleteLater()
+    QtCore.QCoreApplication.sendPostedEvents(None,
+                                             QtCore.QEvent.DeferredDelete)
@@ -0,0 +1,57 @@
+"""
+Tests of the editors handed out by PooledEditorDelegate.
+
+@author: Eddie
+"""
+
+from PyQt5 import QtWidgets, QtGui
+
+from widgets import IPAddressEditDelegate
+
+
+def _view() -> QtWidgets.QTableView:
+    model = QtGui.QStandardItemModel(3, 1)
+    for row in range(model.rowCount()):
+        model.setData(model.index(row, 0), '10.0.0.{}'.format(row))
+
+    view = QtWidgets.QTableView()
+    view.setModel(model)
+    view.setItemDelegateForColumn(0, IPAddressEditDelegate(view))
+    return view
+
+
+def test_persistent_editors_in_one_column_are_separate(shown):
+    view = _view()
+    shown(view)
+    first = view.model().index(0, 0)
+    second = view.model().index(1, 0)
+
+    view.openPersistentEditor(first)
+    view.openPersistentEditor(second)
+    first_editor = view.indexWidget(first)
+    second_editor = view.indexWidget(second)
+
+    assert first_editor is not second_editor
+    assert first_editor.text() == '10.0.0.0'
+    assert second_editor.text() == '10.0.0.1'
+
+    view.closePersistentEditor(first)
+    QtWidgets.QApplication.processEvents()
+    assert view.indexWidget(second) is second_editor
+    assert second_editor.isVisible()
+    assert second_editor.text() == '10.0.0.1'
+
+
+def test_closed_editor_is_reused(shown):
+    view = _view()
+    shown(view)
+    first = view.model().index(0, 0)
+
+    view.openPersistentEditor(first)
+    editor = view.indexWidget(first)
+    view.closePersistentEditor(first)
+
+    second = view.model().index(1, 0)
+    view.openPersistentEditor(second)
+    assert view.indexWidget(second) is editor
+    assert editor.text() == '10.0.0.1'
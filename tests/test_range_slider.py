@@ -0,0 +1,59 @@
+"""
+Tests of the repainting of RangeSlider.
+
+@author: Eddie
+"""
+
+import time
+
+from PyQt5 import QtWidgets, QtCore
+
+from widgets import RangeSlider
+
+
+def _slider() -> RangeSlider:
+    slider = RangeSlider(QtCore.Qt.Horizontal)
+    slider.resize(400, 30)
+    slider.setRange(0, 100)
+    slider.set_values([20, 80])
+    return slider
+
+
+def test_set_low_repaints_only_the_handle(shown):
+    slider = _slider()
+    recorder = shown(slider)
+
+    slider.set_low(25)
+    QtWidgets.QApplication.processEvents()
+
+    painted = recorder.painted()
+    assert not painted.isEmpty()
+    assert painted.width() < slider.width() / 4
+    assert painted.intersects(slider._handle_rect(20))
+    assert painted.intersects(slider._handle_rect(25))
+    assert not painted.intersects(slider._handle_rect(80))
+
+
+def test_set_high_repaints_only_the_handle(shown):
+    slider = _slider()
+    recorder = shown(slider)
+
+    slider.set_high(70)
+    QtWidgets.QApplication.processEvents()
+
+    painted = recorder.painted()
+    assert not painted.isEmpty()
+    assert painted.width() < slider.width() / 4
+    assert not painted.intersects(slider._handle_rect(20))
+
+
+def test_wide_range_ticks_paint_quickly(shown):
+    slider = RangeSlider(QtCore.Qt.Horizontal)
+    slider.resize(400, 30)
+    slider.setTickPosition(QtWidgets.QSlider.TicksBelow)
+    slider.setRange(0, 10**12)
+    slider.set_values([0, 10**12])
+
+    start = time.perf_counter()
+    shown(slider)
+    assert time.perf_counter() - start < 1.0
@@ -0,0 +1,79 @@
+"""
+Tests of the repainting and animation of ToggleSwitch.
+
+@author: Eddie
+"""
+
+import gc
+import sys
+
+from PyQt5 import QtWidgets, QtCore, QtGui
+from PyQt5.QtTest import QTest
+
+from widgets import ToggleSwitch
+
+
+def _press_space(switch: ToggleSwitch):
+    """Toggle a switch with the space bar, which animates it."""
+    for kind in (QtCore.QEvent.KeyPress, QtCore.QEvent.KeyRelease):
+        QtWidgets.QApplication.sendEvent(switch, QtGui.QKeyEvent(
+            kind, QtCore.Qt.Key_Space, QtCore.Qt.NoModifier, ' '
+            ))
+
+
+def _settle():
+    """Run the event loop and delete what's waiting to be deleted."""
+    QtWidgets.QApplication.processEvents()
+    QtCore.QCoreApplication.sendPostedEvents(None,
+                                             QtCore.QEvent.DeferredDelete)
+
+
+def test_offset_repaints_only_the_thumb(shown):
+    switch = ToggleSwitch()
+    recorder = shown(switch)
+
+    # noinspection PyPropertyAccess
+    switch.offset = switch.offset + 4
+    QtWidgets.QApplication.processEvents()
+
+    painted = recorder.painted()
+    assert not painted.isEmpty()
+    assert painted.width() < switch.width()
+    assert painted.width() <= 2 * switch._thumbRadius + 4 + 4
+
+
+def test_toggling_keeps_objects_and_memory_flat(qapp):
+    # Shown without recording the paints, which would pile up.
+    switch = ToggleSwitch()
+    switch.show()
+    QTest.qWaitForWindowExposed(switch)
+
+    # Warm up the caches before measuring.
+    for _ in range(1000):
+        _press_space(switch)
+    _settle()
+    gc.collect()
+    objects = len(gc.get_objects())
+    blocks = sys.getallocatedblocks()
+
+    most_animations = 0
+    for i in range(100000):
+        _press_space(switch)
+        if i % 1000 == 0:
+            _settle()
+            most_animations = max(most_animations, len(
+                switch.findChildren(QtCore.QAbstractAnimation)
+                ))
+    _settle()
+    gc.collect()
+
+    # The one animation is reused, and nothing piles up.
+    assert most_animations <= 1
+    assert len(gc.get_objects()) - objects < 100
+    assert sys.getallocatedblocks() - blocks < 1000
+
+    # It's released once it finishes.
+    QTest.qWait(switch._anim + 100)
+    _settle()
+    assert not switch.findChildren(QtCore.QAbstractAnimation)
+    switch.close()
@@ -1,7 +1,32 @@
+from .multi_slider import MultiSlider
 from .range_slider import RangeSlider
+from .pooled_editor_delegate import PooledEditorDelegate
+from .range_slider_delegate import RangeSliderDelegate
+from .background_consumer import BackgroundConsumer
 from .scroll_line_edit import ScrollLineEdit
 from .toggle_password_edit import TogglePasswordEdit
 from .toggle_switch import ToggleSwitch
+from .toggle_switch_group import ToggleSwitchGroup
+from .toggle_switch_delegate import ToggleSwitchDelegate
+from .animation import (
+    AnimationFull, AnimationCapped, AnimationInstant, animation_policy,
+    set_animation_policy,
+    )
 from .plus_minus_box import PlusMinusBox
+from .plus_minus_box_delegate import PlusMinusBoxDelegate
+from .ip_address_edit_delegate import IPAddressEditDelegate
 from .increase_decrease_button import IncreaseDecreaseButton
 from .labeled_line_edit import LabeledLineEdit
+
+# The widgets over NumPy arrays and datetime64 values are only available
+# with NumPy, so the rest of the widgets can be used without it.
+try:
+    import numpy as _numpy
+except ImportError:  # pragma: no cover
+    pass
+else:
+    from .histogram_range_slider import HistogramRangeSlider
+    from .time_range_slider import TimeRangeSlider
+    from .range_filter import RangeFilter
+    from .cross_filter import CrossFilter
+    del _numpy
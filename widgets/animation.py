@@ -0,0 +1,145 @@
+"""
+The animation policy shared by all the widgets of the library.
+
+Over a remote session, such as VNC or X11 forwarding, every frame of an
+animation is a round trip, so animations can be capped to a low frame
+rate or turned off. The policy is set with set_animation_policy, or with
+the PYQT_WIDGETS_ANIMATION environment variable before the library is
+imported:
+
+- ``full``: animate at the full frame rate (the default).
+- ``capped`` or ``capped:<fps>``: animate at a capped frame rate.
+- ``instant``: jump to the end of animations.
+
+@author: Eddie
+"""
+
+import os
+import warnings
+from typing import Optional, Tuple
+
+from PyQt5 import QtWidgets
+
+#: Animate at the full frame rate.
+AnimationFull = 0
+#: Animate at a capped frame rate.
+AnimationCapped = 1
+#: Jump to the end of animations.
+AnimationInstant = 2
+
+#: The environment variable the policy is read from.
+ENVIRONMENT_VARIABLE = 'PYQT_WIDGETS_ANIMATION'
+
+_DEFAULT_CAPPED_FRAME_RATE = 10.0
+
+
+def _from_environment() -> Tuple[int, float]:
+    """Read the policy and capped frame rate from the environment."""
+    setting = os.environ.get(ENVIRONMENT_VARIABLE, '').strip().lower()
+    name, _, rate = setting.partition(':')
+
+    policies = {
+        '': AnimationFull,
+        'full': AnimationFull,
+        'capped': AnimationCapped,
+        'instant': AnimationInstant,
+    }
+    try:
+        policy = policies[name]
+        frame_rate = float(rate) if rate else _DEFAULT_CAPPED_FRAME_RATE
+        if frame_rate <= 0:
+            raise ValueError(frame_rate)
+    except (KeyError, ValueError):
+        warnings.warn('Ignoring invalid {}={!r}.'.format(
+            ENVIRONMENT_VARIABLE, os.environ[ENVIRONMENT_VARIABLE]
+            ))
+        return AnimationFull, _DEFAULT_CAPPED_FRAME_RATE
+    return policy, frame_rate
+
+
+_policy, _capped_frame_rate = _from_environment()
+
+
+def animation_policy() -> int:
+    """Get the animation policy.
+
+    Returns
+    -------
+    int
+        One of AnimationFull, AnimationCapped or AnimationInstant.
+
+    """
+    return _policy
+
+
+def set_animation_policy(policy: int, frame_rate: Optional[float] = None):
+    """Set the animation policy of all the widgets.
+
+    Animations already running pick up the new policy on their next frame.
+
+    Parameters
+    ----------
+    policy:
+        One of AnimationFull, AnimationCapped or AnimationInstant.
+    frame_rate:
+        The frame rate of capped animations (frames per second). If None,
+        it's unchanged.
+
+    """
+    global _policy, _capped_frame_rate
+
+    if policy not in (AnimationFull, AnimationCapped, AnimationInstant):
+        raise ValueError('Unknown animation policy {!r}.'.format(policy))
+    if frame_rate is not None:
+        if frame_rate <= 0:
+            raise ValueError('The frame rate must be positive.')
+        _capped_frame_rate = frame_rate
+    _policy = policy
+
+
+def capped_frame_rate() -> float:
+    """Get the frame rate of capped animations.
+
+    Returns
+    -------
+    float
+        The frame rate (frames per second).
+
+    """
+    return _capped_frame_rate
+
+
+def frame_interval() -> int:
+    """Get the shortest time between two frames of an animation.
+
+    Returns
+    -------
+    int
+        The time between frames (milliseconds), or 0 if not capped.
+
+    """
+    if _policy == AnimationCapped:
+        return max(1, round(1000 / _capped_frame_rate))
+    return 0
+
+
+def can_animate(widget: QtWidgets.QWidget) -> bool:
+    """Get whether a widget should animate, or jump to the end.
+
+    Widgets don't animate if the policy is instant, or while they're
+    hidden or their window is minimized, where no one sees the frames.
+
+    Parameters
+    ----------
+    widget:
+        The widget to animate.
+
+    Returns
+    -------
+    bool
+        Whether the widget should animate.
+
+    """
+    return (_policy != AnimationInstant
+            and widget.isVisible()
+            and not widget.window().isMinimized())
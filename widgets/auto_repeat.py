@@ -0,0 +1,134 @@
+"""
+Press-and-hold auto-repeat with an accelerating step for buttons.
+
+@author: Eddie
+"""
+
+from typing import Optional
+
+from PyQt5 import QtWidgets, QtCore
+
+
+class AutoRepeat(QtCore.QObject):
+    """Repeat a step while a button is held down, growing the step size.
+
+    After the button has been held down for the delay, stepped is emitted
+    every interval. The step starts at 1 and is multiplied by the factor
+    every accelerate_after repeats (1, 10, 100...), up to the maximum step.
+    When the button is released, finished is emitted.
+
+    A click that's released before the delay doesn't repeat, so the
+    button's own clicked signal or action makes the single step. The click
+    that ends a hold should be ignored, since the hold already stepped, so
+    is_repeating stays True until the click has been delivered, and
+    finished is emitted after it.
+    """
+
+    #: Signal emitted with the size of each repeated step.
+    stepped = QtCore.pyqtSignal(int)
+    #: Signal emitted when the button is released.
+    finished = QtCore.pyqtSignal()
+
+    def __init__(self, button: QtWidgets.QAbstractButton,
+                 parent: Optional[QtCore.QObject] = None,
+                 delay: int = 400, interval: int = 50,
+                 accelerate_after: int = 20, factor: int = 10,
+                 max_step: Optional[int] = None):
+        """Initialize the auto-repeat of a button.
+
+        Parameters
+        ----------
+        button:
+            The button to repeat while held down.
+        parent:
+            The parent QObject. If not given, the button is the parent.
+        delay:
+            The time the button is held before repeating (milliseconds).
+        interval:
+            The time between repeats (milliseconds).
+        accelerate_after:
+            The number of repeats before the step grows.
+        factor:
+            The factor the step grows by.
+        max_step:
+            The largest step, or None for no limit.
+
+        """
+        super(AutoRepeat, self).__init__(
+            button if parent is None else parent
+            )
+
+        self._delay = delay
+        self._interval = interval
+        self._accelerate_after = accelerate_after
+        self._factor = factor
+        self._max_step = max_step
+
+        # The number of repeats since the button was pressed
+        self._count = 0
+        self._repeating = False
+
+        self._timer = QtCore.QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self._repeat)
+
+        # The clicked signal and action of the button come just before or
+        # after released, so finish once they've been delivered.
+        self._finish_timer = QtCore.QTimer(self)
+        self._finish_timer.setSingleShot(True)
+        self._finish_timer.setInterval(0)
+        self._finish_timer.timeout.connect(self._finish)
+
+        button.pressed.connect(self._on_pressed)
+        button.released.connect(self._on_released)
+
+    def is_repeating(self) -> bool:
+        """Get whether the button has repeated since it was pressed.
+
+        Returns
+        -------
+        bool
+            Whether the button has repeated since it was pressed, until
+            its release has been handled.
+
+        """
+        return self._repeating
+
+    def step(self) -> int:
+        """Get the size of the next step.
+
+        Returns
+        -------
+        int
+            The size of the next step.
+
+        """
+        step = self._factor ** (self._count // self._accelerate_after)
+        if self._max_step is not None:
+            step = min(step, self._max_step)
+        return step
+
+    def _on_pressed(self):
+        """Start waiting for the delay."""
+        self._finish_timer.stop()
+        self._count = 0
+        self._repeating = False
+        self._timer.start(self._delay)
+
+    def _on_released(self):
+        """Stop repeating, and finish after the click."""
+        self._timer.stop()
+        self._finish_timer.start()
+
+    def _finish(self):
+        """Finish the press."""
+        self._repeating = False
+        self.finished.emit()
+
+    def _repeat(self):
+        """Emit the next step and wait for the next repeat."""
+        self._repeating = True
+        self._timer.start(self._interval)
+        step = self.step()
+        self._count += 1
+        self.stepped.emit(step)
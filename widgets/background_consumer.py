@@ -0,0 +1,257 @@
+"""
+Run the slot behind a widget's signal on a thread pool, latest value wins.
+
+@author: Eddie
+"""
+
+import time
+from typing import Any, Callable, Optional
+
+from PyQt5 import QtWidgets, QtCore
+
+
+class _TaskSignals(QtCore.QObject):
+    """Signals of a task, delivered to the GUI thread."""
+
+    #: Signal emitted with the generation of the task and its result.
+    finished = QtCore.pyqtSignal(int, object)
+    #: Signal emitted with the generation of the task and its exception.
+    failed = QtCore.pyqtSignal(int, object)
+
+
+class _Task(QtCore.QRunnable):
+    """A call of the consumer's function on the thread pool."""
+
+    def __init__(self, function: Callable, args: tuple, generation: int,
+                 signals: _TaskSignals):
+        super(_Task, self).__init__()
+        self._function = function
+        self._args = args
+        self._generation = generation
+        self._signals = signals
+
+    def run(self):
+        try:
+            result = self._function(*self._args)
+        except Exception as error:
+            self._signals.failed.emit(self._generation, error)
+        else:
+            self._signals.finished.emit(self._generation, result)
+
+
+class BackgroundConsumer(QtCore.QObject):
+    """Run a function on a thread pool with the latest value of a signal.
+
+    Connect a signal, such as RangeSlider.sliderMoved or
+    PlusMinusBox.value_changed, to submit and the function is called with
+    the signal's arguments on a thread pool, so a slow function doesn't
+    block the GUI thread. Only one call runs at a time. Values submitted
+    while it runs replace each other, so only the latest one is run next,
+    and the result of a call is dropped if a newer value was submitted in
+    the meantime. The newest result is delivered on the GUI thread by the
+    result_ready signal.
+
+    The time from submitting a value to delivering its result, and the
+    number of values dropped, are kept for monitoring.
+    """
+
+    #: Signal emitted on the GUI thread with the newest result.
+    result_ready = QtCore.pyqtSignal(object)
+    #: Signal emitted on the GUI thread if the newest call raised, with the
+    #: exception.
+    failed = QtCore.pyqtSignal(object)
+
+    def __init__(self, function: Callable[..., Any],
+                 parent: Optional[QtCore.QObject] = None,
+                 thread_pool: Optional[QtCore.QThreadPool] = None):
+        """Initialize the consumer.
+
+        Parameters
+        ----------
+        function:
+            The function to run with the submitted values. It's run off
+            the GUI thread, so it mustn't touch any widgets.
+        parent:
+            The parent QObject, if any.
+        thread_pool:
+            The thread pool to run the function on. If not given, the
+            global thread pool is used.
+
+        """
+        super(BackgroundConsumer, self).__init__(parent)
+
+        self._function = function
+        self._thread_pool = (QtCore.QThreadPool.globalInstance()
+                             if thread_pool is None else thread_pool)
+
+        self._signals = _TaskSignals(self)
+        self._signals.finished.connect(self._on_finished)
+        self._signals.failed.connect(self._on_failed)
+
+        # The generation of the latest value submitted, and the value
+        # waiting for the running call to finish.
+        self._generation = 0
+        self._running = False
+        self._pending: Optional[tuple] = None
+        self._submit_times = {}
+
+        self._latency: Optional[float] = None
+        self._submitted_count = 0
+        self._dropped_count = 0
+
+    def submit(self, *args):
+        """Submit a value to run the function with.
+
+        Any value submitted before it that hasn't run yet is dropped, and
+        the result of a running call is dropped when it finishes.
+
+        Parameters
+        ----------
+        args:
+            The arguments to call the function with.
+
+        """
+        self._generation += 1
+        self._submitted_count += 1
+        self._submit_times[self._generation] = time.perf_counter()
+
+        if self._running:
+            if self._pending is not None:
+                self._drop(self._pending[0])
+            self._pending = (self._generation, args)
+        else:
+            self._start(self._generation, args)
+
+    def cancel(self):
+        """Drop the waiting value and the result of the running call."""
+        if self._pending is not None:
+            self._drop(self._pending[0])
+            self._pending = None
+        self._generation += 1
+
+    def is_busy(self) -> bool:
+        """Get whether a call is running or waiting to run.
+
+        Returns
+        -------
+        bool
+            Whether a call is running or waiting to run.
+
+        """
+        return self._running or self._pending is not None
+
+    def latency(self) -> Optional[float]:
+        """Get the latency of the last delivered result.
+
+        Returns
+        -------
+        Optional[float]
+            The time from submitting the value to delivering its result
+            (milliseconds), or None if no result has been delivered.
+
+        """
+        return self._latency
+
+    def submitted_count(self) -> int:
+        """Get the number of values submitted.
+
+        Returns
+        -------
+        int
+            The number of values submitted.
+
+        """
+        return self._submitted_count
+
+    def dropped_count(self) -> int:
+        """Get the number of values dropped for a newer value.
+
+        Returns
+        -------
+        int
+            The number of values that were never run, or whose result was
+            dropped.
+
+        """
+        return self._dropped_count
+
+    def _start(self, generation: int, args: tuple):
+        """Run the function on the thread pool."""
+        self._running = True
+        self._thread_pool.start(
+            _Task(self._function, args, generation, self._signals)
+            )
+
+    def _drop(self, generation: int):
+        """Count a value as dropped."""
+        self._submit_times.pop(generation, None)
+        self._dropped_count += 1
+
+    def _finish(self, generation: int) -> bool:
+        """Start the next call after one finished.
+
+        Parameters
+        ----------
+        generation:
+            The generation of the call that finished.
+
+        Returns
+        -------
+        bool
+            Whether the call was for the latest value, so its result should
+            be delivered.
+
+        """
+        self._running = False
+
+        latest = generation == self._generation
+        if latest:
+            self._latency = 1000 * (time.perf_counter()
+                                    - self._submit_times.pop(generation))
+        else:
+            self._drop(generation)
+
+        if self._pending is not None:
+            self._start(*self._pending)
+            self._pending = None
+
+        return latest
+
+    def _on_finished(self, generation: int, result: Any):
+        """Deliver the result of a call, if it's the newest."""
+        if self._finish(generation):
+            self.result_ready.emit(result)
+
+    def _on_failed(self, generation: int, error: Exception):
+        """Deliver the exception of a call, if it's the newest."""
+        if self._finish(generation):
+            self.failed.emit(error)
+
+
+if __name__ == '__main__':
+    try:
+        from .range_slider import RangeSlider
+    except ImportError:  # Run as a script, not from the package
+        from range_slider import RangeSlider
+
+    app = QtWidgets.QApplication.instance()
+    if app is None:
+        app = QtWidgets.QApplication([])
+
+    def slow_query(low: int, high: int) -> int:
+        time.sleep(0.1)
+        return high - low
+
+    slider = RangeSlider(QtCore.Qt.Horizontal)
+    slider.setRange(0, 86400)
+    slider.set_low(0)
+    slider.set_high(86400)
+
+    consumer = BackgroundConsumer(slow_query)
+    slider.sliderMoved.connect(consumer.submit)
+    consumer.result_ready.connect(
+        lambda result: print(result, consumer.latency(),
+                             consumer.dropped_count())
+        )
+    slider.show()
+    app.exec()
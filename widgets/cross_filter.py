@@ -0,0 +1,326 @@
+"""
+A coordinator for range sliders filtering the columns of one table.
+
+@author: Eddie
+"""
+
+import functools
+from typing import List, Optional, Sequence
+
+from PyQt5 import QtWidgets, QtCore
+
+try:
+    from .histogram_range_slider import HistogramRangeSlider
+    from .multi_slider import Number
+    from .range_filter import RangeFilter
+    from .range_slider import RangeSlider
+except ImportError:  # Run as a script, not from the package
+    from histogram_range_slider import HistogramRangeSlider
+    from multi_slider import Number
+    from range_filter import RangeFilter
+    from range_slider import RangeSlider
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+
+class CrossFilter(QtCore.QObject):
+    """The rows of a table selected by range sliders on its columns.
+
+    Each dimension is a column of the table filtered by a range slider,
+    through a RangeFilter that keeps the dimension's mask. For each row,
+    the number of dimensions excluding it is kept, so when a slider moves
+    only the rows whose mask changed in that dimension are updated, rather
+    than recomputing the conjunction of every filter.
+
+    With linked histograms on, the histogram of each HistogramRangeSlider
+    shows the distribution of the rows selected by all the other
+    dimensions, which is also updated only for the rows that changed.
+
+    Needs NumPy.
+    """
+
+    #: Signal emitted when the selection changes, with the number of rows
+    #: selected by all the dimensions.
+    selection_changed = QtCore.pyqtSignal(int)
+
+    def __init__(self, parent: Optional[QtCore.QObject] = None):
+        """Initialize the cross filter, with no dimensions.
+
+        Parameters
+        ----------
+        parent:
+            The parent QObject, if any.
+
+        """
+        if np is None:
+            raise ImportError('NumPy is needed to filter data.')
+
+        super(CrossFilter, self).__init__(parent)
+
+        self._filters: List[RangeFilter] = []
+
+        # The number of dimensions excluding each row, and the rows no
+        # dimension excludes.
+        self._misses = None
+        self._mask = None
+        self._count = 0
+
+        # The bin of each row, the filtered counts and the counts the
+        # slider had before they were filtered, per dimension with a
+        # histogram.
+        self._linked_histograms = False
+        self._bins: List[Optional[np.ndarray]] = []
+        self._counts: List[Optional[np.ndarray]] = []
+        self._full_counts: List[Optional[Sequence[Number]]] = []
+
+    def add_dimension(self, slider: RangeSlider, values) -> RangeFilter:
+        """Add a column filtered by a range slider.
+
+        Parameters
+        ----------
+        slider:
+            The slider selecting the range of the column.
+        values:
+            A one dimensional array like of the values of the column, the
+            same length as the other columns.
+
+        Returns
+        -------
+        RangeFilter
+            The filter of the column.
+
+        """
+        range_filter = RangeFilter(slider, values, parent=self)
+
+        size = len(range_filter.data())
+        if self._misses is None:
+            self._misses = np.zeros(size, dtype=np.uint16)
+        elif size != len(self._misses):
+            raise ValueError('All the columns must be the same length.')
+
+        self._misses += ~range_filter.mask()
+        self._mask = self._misses == 0
+        self._count = int(np.count_nonzero(self._mask))
+
+        self._filters.append(range_filter)
+        self._bins.append(None)
+        self._counts.append(None)
+        self._full_counts.append(None)
+        range_filter.selection_changed.connect(functools.partial(
+            self._on_selection_changed, len(self._filters) - 1
+            ))
+
+        if self._linked_histograms:
+            self.refresh_histograms()
+        self.selection_changed.emit(self._count)
+
+        return range_filter
+
+    def filters(self) -> List[RangeFilter]:
+        """Get the filters of the dimensions.
+
+        Returns
+        -------
+        List[RangeFilter]
+            The filter of each dimension, in the order they were added.
+
+        """
+        return list(self._filters)
+
+    def mask(self):
+        """Get the mask of the rows selected by all the dimensions.
+
+        The mask is updated in place, so copy it to keep a snapshot.
+
+        Returns
+        -------
+        Optional[numpy.ndarray]
+            A boolean array, True for the selected rows, or None if there
+            are no dimensions.
+
+        """
+        return self._mask
+
+    def count(self) -> int:
+        """Get the number of rows selected by all the dimensions.
+
+        Returns
+        -------
+        int
+            The number of selected rows.
+
+        """
+        return self._count
+
+    def linked_histograms(self) -> bool:
+        """Get whether the histograms show the filtered distributions.
+
+        Returns
+        -------
+        bool
+            Whether the histograms are linked.
+
+        """
+        return self._linked_histograms
+
+    def set_linked_histograms(self, linked: bool):
+        """Set whether the histograms show the filtered distributions.
+
+        When linked, the histogram of each HistogramRangeSlider dimension
+        shows the rows selected by all the other dimensions. The bins of
+        the slider are kept. When unlinked, the sliders get back the
+        counts they had before they were linked.
+
+        Parameters
+        ----------
+        linked:
+            Whether the histograms are linked.
+
+        """
+        self._linked_histograms = linked
+        if linked:
+            self.refresh_histograms()
+            return
+
+        for i, range_filter in enumerate(self._filters):
+            if self._full_counts[i] is not None:
+                slider = range_filter.slider()
+                slider.set_counts(self._full_counts[i], slider.edges())
+            self._bins[i] = None
+            self._counts[i] = None
+            self._full_counts[i] = None
+
+    def refresh_histograms(self):
+        """Recompute the linked histograms from scratch.
+
+        Call this after changing the bins of a HistogramRangeSlider
+        dimension.
+        """
+        for i, range_filter in enumerate(self._filters):
+            slider = range_filter.slider()
+            if (not isinstance(slider, HistogramRangeSlider)
+                    or len(slider.edges()) == 0):
+                self._bins[i] = None
+                self._counts[i] = None
+                self._full_counts[i] = None
+                continue
+
+            # Keep the counts of the slider, unless they're the filtered
+            # counts set before.
+            if (self._counts[i] is None
+                    or slider.counts() is not self._counts[i]):
+                self._full_counts[i] = slider.counts()
+
+            # Put the rows outside the bins in an extra bin at the end,
+            # which is dropped. The last edge is part of the last bin.
+            edges = np.asarray(slider.edges())
+            bins = np.searchsorted(edges, range_filter.data(), side='right')
+            bins -= 1
+            bins[range_filter.data() == edges[-1]] = len(edges) - 2
+            bins[bins < 0] = len(edges) - 1
+            self._bins[i] = bins
+
+            selected = self._misses - ~range_filter.mask() == 0
+            self._counts[i] = np.bincount(
+                bins[selected], minlength=len(edges)
+                )[:-1]
+            slider.set_counts(self._counts[i], slider.edges())
+
+    def _on_selection_changed(self, index: int, added, removed):
+        """Update the selection after the mask of a dimension changed.
+
+        Parameters
+        ----------
+        index:
+            The index of the dimension.
+        added:
+            The indices of the rows the dimension now selects.
+        removed:
+            The indices of the rows the dimension no longer selects.
+
+        """
+        rows = np.concatenate((added, removed))
+        old_misses = self._misses[rows]
+
+        self._misses[added] -= 1
+        self._misses[removed] += 1
+
+        selected = added[self._misses[added] == 0]
+        deselected = removed[self._misses[removed] == 1]
+        self._mask[selected] = True
+        self._mask[deselected] = False
+        self._count += len(selected) - len(deselected)
+
+        if self._linked_histograms:
+            self._update_histograms(index, rows, old_misses)
+
+        self.selection_changed.emit(self._count)
+
+    def _update_histograms(self, index: int, rows, old_misses):
+        """Update the linked histograms of the other dimensions.
+
+        Parameters
+        ----------
+        index:
+            The index of the dimension whose mask changed.
+        rows:
+            The indices of the rows whose mask changed.
+        old_misses:
+            The number of dimensions excluding each row before the change.
+
+        """
+        new_misses = self._misses[rows]
+
+        for i, range_filter in enumerate(self._filters):
+            if i == index or self._bins[i] is None:
+                continue
+
+            # A row counts in this histogram if no other dimension
+            # excludes it.
+            excluded = ~range_filter.mask()[rows]
+            before = old_misses - excluded == 0
+            after = new_misses - excluded == 0
+            changed = before != after
+            if not changed.any():
+                continue
+
+            delta = np.where(after[changed], 1, -1)
+            self._counts[i] += np.bincount(
+                self._bins[i][rows[changed]], weights=delta,
+                minlength=len(self._counts[i]) + 1
+                )[:-1].astype(self._counts[i].dtype)
+
+            slider = range_filter.slider()
+            slider.set_counts(self._counts[i], slider.edges())
+
+
+if __name__ == "__main__":
+    app = QtWidgets.QApplication.instance()
+    if app is None:
+        app = QtWidgets.QApplication([])
+
+    table = np.random.standard_normal((1000000, 3))
+
+    cross_filter = CrossFilter()
+    cross_filter.selection_changed.connect(print)
+
+    layout = QtWidgets.QVBoxLayout()
+    for column in table.T:
+        slider = HistogramRangeSlider(QtCore.Qt.Horizontal)
+        slider.setMinimumHeight(60)
+        slider.setRange(-5.0, 5.0)
+        slider.set_resolution(0.01)
+        slider.set_data(column)
+        slider.set_low(-5.0)
+        slider.set_high(5.0)
+        cross_filter.add_dimension(slider, column)
+        layout.addWidget(slider)
+    cross_filter.set_linked_histograms(True)
+
+    widget = QtWidgets.QWidget()
+    widget.setLayout(layout)
+    widget.show()
+    app.exec()
@@ -0,0 +1,297 @@
+"""
+A range slider with a histogram of the data it filters behind the groove.
+
+@author: Eddie
+"""
+
+from typing import Optional, Sequence
+
+from PyQt5 import QtWidgets, QtCore, QtGui
+
+try:
+    from .multi_slider import Number
+    from .range_slider import RangeSlider
+except ImportError:  # Run as a script, not from the package
+    from multi_slider import Number
+    from range_slider import RangeSlider
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+
+class HistogramRangeSlider(RangeSlider):
+    """A range slider with a density histogram behind the groove.
+
+    The histogram is binned once, when the data or bin counts are set, and
+    drawn into the cached background of the slider. A second copy is drawn
+    in the highlight color, and each repaint only shows it over the span
+    between the low and high sliders, so dragging never re-bins the data
+    or redraws the bars.
+
+    Setting the data needs NumPy. Precomputed bin counts can be set
+    without it.
+    """
+
+    def __init__(self, *args, **kwargs):
+        """Initialize the slider.
+
+        Initializes the range slider, with no histogram.
+
+        """
+        super(HistogramRangeSlider, self).__init__(*args, **kwargs)
+
+        self._counts: Sequence[Number] = []
+        self._edges: Sequence[Number] = []
+
+        # The histogram in the highlight color, shown between the sliders.
+        self._selected_background: Optional[QtGui.QPixmap] = None
+
+    def set_data(self, data, bins: int = 64):
+        """Set the data to draw the histogram of.
+
+        The data is binned over the range of the slider, so set the range
+        first. Values that are outside the range or not finite are left
+        out.
+
+        Parameters
+        ----------
+        data:
+            An array like of the values to draw the histogram of.
+        bins:
+            The number of bins in the histogram.
+
+        """
+        if np is None:
+            raise ImportError('NumPy is needed to bin the histogram data.')
+
+        data = np.asarray(data)
+        if data.dtype.kind == 'f':
+            data = data[np.isfinite(data)]
+
+        counts, edges = np.histogram(
+            data, bins=bins, range=(self.minimum(), self.maximum())
+            )
+        self.set_counts(counts, edges)
+
+    def set_counts(self, counts: Sequence[Number],
+                   edges: Optional[Sequence[Number]] = None):
+        """Set the bin counts of the histogram.
+
+        Parameters
+        ----------
+        counts:
+            The number of values in each bin.
+        edges:
+            The edges of the bins, one more than the number of bins. If not
+            given, the bins are spread evenly over the range of the slider.
+
+        """
+        if edges is None:
+            step = (self.maximum() - self.minimum()) / max(len(counts), 1)
+            edges = [self.minimum() + i * step
+                     for i in range(len(counts) + 1)]
+
+        if len(edges) != len(counts) + 1:
+            raise ValueError('There must be one more edge than bin counts.')
+
+        self._counts = counts
+        self._edges = edges
+        self._invalidate_background()
+        self.update()
+
+    def counts(self) -> Sequence[Number]:
+        """Get the bin counts of the histogram.
+
+        Returns
+        -------
+        Sequence[Number]
+            The number of values in each bin.
+
+        """
+        return self._counts
+
+    def edges(self) -> Sequence[Number]:
+        """Get the bin edges of the histogram.
+
+        Returns
+        -------
+        Sequence[Number]
+            The edges of the bins.
+
+        """
+        return self._edges
+
+    def paintEvent(self, event: QtGui.QPaintEvent):
+        """Paint the slider object.
+
+        Runs when the object is drawn. The cached histogram and groove are
+        drawn, then the highlighted histogram over the selected span, then
+        the handles.
+
+        Parameters
+        ----------
+        event:
+            The event object.
+
+        """
+        painter = QtGui.QPainter(self)
+        painter.drawPixmap(0, 0, self._background_pixmap())
+
+        painter.save()
+        painter.setClipRect(self._selected_rect())
+        painter.drawPixmap(0, 0, self._selected_pixmap())
+        painter.restore()
+
+        self._paint_handles(painter, event.rect())
+
+    def _update_dirty(self):
+        """Repaint the dirty region and clear it.
+
+        The selected span changes between the old and new positions of a
+        handle, so the whole strip across the slider is repainted.
+        """
+        if not self._dirty_region.isEmpty():
+            rect = self._dirty_region.boundingRect()
+            if self.orientation() == QtCore.Qt.Horizontal:
+                rect.setTop(0)
+                rect.setBottom(self.height() - 1)
+            else:
+                rect.setLeft(0)
+                rect.setRight(self.width() - 1)
+            self._dirty_region = QtGui.QRegion(rect)
+
+        super(HistogramRangeSlider, self)._update_dirty()
+
+    def _invalidate_background(self):
+        """Drop the cached histograms, groove and tick marks."""
+        super(HistogramRangeSlider, self)._invalidate_background()
+        self._selected_background = None
+
+    def _selected_pixmap(self) -> QtGui.QPixmap:
+        """Get the highlighted histogram, drawing it if needed.
+
+        Returns
+        -------
+        QtGui.QPixmap
+            The cached highlighted histogram, groove and tick marks.
+
+        """
+        if (self._selected_background is None
+                or self._selected_background.devicePixelRatioF()
+                != self.devicePixelRatioF()):
+            self._selected_background = self._render_pixmap(
+                self._paint_selected_background
+                )
+
+        return self._selected_background
+
+    def _paint_background(self, painter: QtGui.QPainter):
+        """Draw the histogram, groove and tick marks.
+
+        Parameters
+        ----------
+        painter:
+            The painter to draw with.
+
+        """
+        self._paint_histogram(painter, self.palette().mid())
+        super(HistogramRangeSlider, self)._paint_background(painter)
+
+    def _paint_selected_background(self, painter: QtGui.QPainter):
+        """Draw the highlighted histogram, groove and tick marks.
+
+        Parameters
+        ----------
+        painter:
+            The painter to draw with.
+
+        """
+        self._paint_histogram(painter, self.palette().highlight())
+        super(HistogramRangeSlider, self)._paint_background(painter)
+
+    def _paint_histogram(self, painter: QtGui.QPainter,
+                         brush: QtGui.QBrush):
+        """Draw the bars of the histogram.
+
+        The bars are scaled to the densest bin, which fills the slider.
+
+        Parameters
+        ----------
+        painter:
+            The painter to draw with.
+        brush:
+            The brush to fill the bars with.
+
+        """
+        if len(self._counts) == 0:
+            return
+
+        geometry = self._slider_geometry()
+        horizontal = self.orientation() == QtCore.Qt.Horizontal
+        length = self.height() if horizontal else self.width()
+
+        # Use the density, so uneven bins aren't taller for being wider
+        densities = [count / (end - start) if end > start else 0
+                     for count, start, end
+                     in zip(self._counts, self._edges[:-1], self._edges[1:])]
+        highest = max(densities)
+        if highest <= 0:
+            return
+
+        positions = [self._range_value_to_pixel_pos(edge)
+                     + geometry.slider_length / 2 for edge in self._edges]
+
+        bars = []
+        for i, density in enumerate(densities):
+            size = length * density / highest
+            start, end = sorted((positions[i], positions[i + 1]))
+            if horizontal:
+                bars.append(QtCore.QRectF(start, length - size,
+                                          end - start, size))
+            else:
+                bars.append(QtCore.QRectF(0, start, size, end - start))
+
+        painter.save()
+        painter.setPen(QtCore.Qt.NoPen)
+        painter.setBrush(brush)
+        painter.drawRects(bars)
+        painter.restore()
+
+    def _selected_rect(self) -> QtCore.QRect:
+        """Get the span between the low and high sliders.
+
+        Returns
+        -------
+        QtCore.QRect
+            The rectangle across the slider between the centres of the low
+            and high handles.
+
+        """
+        half = self._slider_geometry().slider_length // 2
+        start, end = sorted((self._range_value_to_pixel_pos(self.low()),
+                             self._range_value_to_pixel_pos(self.high())))
+
+        if self.orientation() == QtCore.Qt.Horizontal:
+            return QtCore.QRect(start + half, 0, end - start, self.height())
+        else:
+            return QtCore.QRect(0, start + half, self.width(), end - start)
+
+
+if __name__ == "__main__":
+    app = QtWidgets.QApplication.instance()
+    if app is None:
+        app = QtWidgets.QApplication([])
+
+    slider = HistogramRangeSlider(QtCore.Qt.Horizontal)
+    slider.setMinimumHeight(60)
+
+    slider.setRange(-5.0, 5.0)
+    slider.set_resolution(0.01)
+    slider.set_data(np.random.standard_normal(5000000), bins=100)
+    slider.set_low(-1.0)
+    slider.set_high(1.0)
+    slider.sliderMoved.connect(print)
+    slider.show()
+    app.exec()
@@ -4,10 +4,15 @@ A double push button that increases and decreases a value.
 @author: Eddie Ruiz
 
 """
-from typing import Optional
+from typing import Optional, Tuple
 
 from PyQt5 import QtWidgets, QtCore, QtGui
 
+try:
+    from .auto_repeat import AutoRepeat
+except ImportError:  # Run as a script, not from the package
+    from auto_repeat import AutoRepeat
+
 
 class _SingleButton(QtWidgets.QAbstractButton):
 
@@ -16,16 +21,12 @@ class _SingleButton(QtWidgets.QAbstractButton):
         super(_SingleButton, self).__init__(parent)
 
         self._left_button = left
+        self._hovered = False
 
-        self._button_clicked_top = {
-            True: self.palette().midlight().color(),
-            False: self.palette().light().color(),
-        }
-
-        self._button_clicked_bottom = {
-            True: self.palette().midlight().color(),
-            False: self.palette().button().color(),
-        }
+        # The position of the text, and the size, font and text it was
+        # measured for.
+        self._text_key: Optional[Tuple[int, int, str, str]] = None
+        self._text_pos = QtCore.QPointF()
 
         self.setMinimumSize(25, 25)
 
@@ -34,69 +35,131 @@ class _SingleButton(QtWidgets.QAbstractButton):
 
     def paintEvent(self, event: QtGui.QPaintEvent) -> None:
         p = QtGui.QPainter(self)
-        p.setRenderHint(p.Antialiasing, True)
-
-        width = self.size().width()
-        height = self.size().height()
-
-        path = QtGui.QPainterPath()
-        path.moveTo(height / 2, 0)
-        path.lineTo(width, 0)
-        path.lineTo(width, height)
-        path.lineTo(height / 2, height)
-        path.arcTo(0, 0, height, height, -90, -180)
 
+        # The right button is the left one mirrored.
         if not self._left_button:
+            p.save()
             mirror = QtGui.QTransform(-1, 0, 0, 0, 1, 0, 0, 0, 1)
             p.setTransform(mirror)
-            p.translate(-width, 0)
-
-        if self.isEnabled():
-            gradient = QtGui.QLinearGradient(0, 0, 0, height)
-            gradient.setColorAt(0, self._button_clicked_top[self.isDown()])
-            gradient.setColorAt(1, self._button_clicked_bottom[self.isDown()])
-            brush = QtGui.QBrush(gradient)
-            brush.setStyle(QtCore.Qt.LinearGradientPattern)
-            p.setBrush(brush)
-            p.setPen(QtGui.QPen(self.palette().shadow(), 1))
-        else:
-            p.setBrush(self.palette().light())
-            p.setPen(QtGui.QPen(self.palette().shadow(), 1))
-
-        p.drawPath(path)
+            p.translate(-self.width(), 0)
+        p.drawPixmap(0, 0, self._shape_pixmap())
+        if not self._left_button:
+            p.restore()
 
         p.setPen(QtGui.QPen(self.palette().buttonText(), 1))
         p.setFont(self.font())
-
-        font_width = width/2 - QtGui.QFontMetrics(p.font()).size(
-            QtCore.Qt.TextSingleLine, self.text()
-        ).width()/2
-
-        font_height = height/2 + QtGui.QFontMetrics(p.font()).size(
-            QtCore.Qt.TextSingleLine, self.text()
-        ).height()/4
-        p.drawText(QtCore.QPointF(font_width, font_height), self.text())
+        p.drawText(self._text_position(), self.text())
 
     def enterEvent(self, event: QtCore.QEvent) -> None:
         super(_SingleButton, self).enterEvent(event)
-
-        self._button_clicked_bottom = {
-            True: self.palette().midlight().color(),
-            False: self.palette().light().color(),
-        }
+        self._hovered = True
+        self.update()
 
     def leaveEvent(self, event: QtCore.QEvent) -> None:
         super(_SingleButton, self).leaveEvent(event)
-
-        self._button_clicked_bottom = {
-            True: self.palette().midlight().color(),
-            False: self.palette().button().color(),
-        }
+        self._hovered = False
+        self.update()
+
+    def _shape_pixmap(self) -> QtGui.QPixmap:
+        """
+        Get the pixmap of the shape of the left button.
+
+        The pixmaps are shared by all the buttons through the process-wide
+        pixmap cache, keyed by size, state and colors.
+
+        Returns
+        -------
+        QtGui.QPixmap
+            The shape of the left button.
+        """
+        palette = self.palette()
+        width = self.width()
+        height = self.height()
+        enabled = self.isEnabled()
+        down = self.isDown()
+
+        if enabled:
+            top = palette.midlight() if down else palette.light()
+            if down:
+                bottom = palette.midlight()
+            elif self._hovered:
+                bottom = palette.light()
+            else:
+                bottom = palette.button()
+        else:
+            top = bottom = palette.light()
+        shadow = palette.shadow().color()
+
+        dpr = self.devicePixelRatioF()
+        key = ('IncreaseDecreaseButton.shape:{}x{}:{}:{}:{}:{:08x}:{:08x}:'
+               '{:08x}:{}').format(
+            width, height, enabled, down, self._hovered,
+            top.color().rgba(), bottom.color().rgba(), shadow.rgba(), dpr,
+        )
+
+        pixmap = QtGui.QPixmapCache.find(key)
+        if pixmap is None:
+            pixmap = QtGui.QPixmap(self.size() * dpr)
+            pixmap.setDevicePixelRatio(dpr)
+            pixmap.fill(QtCore.Qt.transparent)
+
+            path = QtGui.QPainterPath()
+            path.moveTo(height / 2, 0)
+            path.lineTo(width, 0)
+            path.lineTo(width, height)
+            path.lineTo(height / 2, height)
+            path.arcTo(0, 0, height, height, -90, -180)
+
+            p = QtGui.QPainter(pixmap)
+            p.setRenderHint(p.Antialiasing, True)
+            if enabled:
+                gradient = QtGui.QLinearGradient(0, 0, 0, height)
+                gradient.setColorAt(0, top.color())
+                gradient.setColorAt(1, bottom.color())
+                p.setBrush(QtGui.QBrush(gradient))
+            else:
+                p.setBrush(top)
+            p.setPen(QtGui.QPen(shadow, 1))
+            p.drawPath(path)
+            p.end()
+
+            QtGui.QPixmapCache.insert(key, pixmap)
+        return pixmap
+
+    def _text_position(self) -> QtCore.QPointF:
+        """
+        Get the position of the text, centered on the button.
+
+        The position is only measured again when the size, font or text
+        changes.
+
+        Returns
+        -------
+        QtCore.QPointF
+            The position of the baseline of the text.
+        """
+        key = (self.width(), self.height(), self.font().key(), self.text())
+        if key != self._text_key:
+            size = QtGui.QFontMetrics(self.font()).size(
+                QtCore.Qt.TextSingleLine, self.text()
+            )
+            self._text_pos = QtCore.QPointF(
+                self.width() / 2 - size.width() / 2,
+                self.height() / 2 + size.height() / 4,
+            )
+            self._text_key = key
+        return self._text_pos
 
 
 class IncreaseDecreaseButton(QtWidgets.QWidget):
     left_clicked = QtCore.pyqtSignal()
     right_clicked = QtCore.pyqtSignal()
+    #: Signal emitted with the step of each click, -1 for the left button
+    #: and 1 for the right, and of each repeat while a button is held down,
+    #: which grows the longer it's held (10, 100...).
+    stepped = QtCore.pyqtSignal(int)
+    #: Signal emitted when a button is released.
+    step_finished = QtCore.pyqtSignal()
 
     def __init__(self, parent: Optional[QtWidgets.QWidget] = None):
         super(IncreaseDecreaseButton, self).__init__(parent)
@@ -108,6 +171,22 @@ class IncreaseDecreaseButton(QtWidgets.QWidget):
         self._right_button.setText('+')
         self._right_button.clicked.connect(lambda: self.right_clicked.emit())
 
+        # The release that ends a hold doesn't step again.
+        self._left_repeat = AutoRepeat(self._left_button)
+        self._left_repeat.stepped.connect(
+            lambda step: self.stepped.emit(-step)
+        )
+        self._left_repeat.finished.connect(self.step_finished)
+        self._left_button.clicked.connect(
+            lambda: self._left_repeat.is_repeating() or self.stepped.emit(-1)
+        )
+        self._right_repeat = AutoRepeat(self._right_button)
+        self._right_repeat.stepped.connect(self.stepped)
+        self._right_repeat.finished.connect(self.step_finished)
+        self._right_button.clicked.connect(
+            lambda: self._right_repeat.is_repeating() or self.stepped.emit(1)
+        )
+
         layout = QtWidgets.QHBoxLayout()
         layout.addWidget(self._left_button)
         layout.addWidget(self._right_button)
@@ -136,6 +215,7 @@ if __name__ == '__main__':
     button.setEnabled(True)
     button.left_clicked.connect(lambda: print('Left Clicked'))
     button.right_clicked.connect(lambda: print('Right Clicked'))
+    button.stepped.connect(print)
     # button.set_size(50, 25)
 
     ref_button = QtWidgets.QPushButton('Test')
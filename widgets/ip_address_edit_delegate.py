@@ -0,0 +1,122 @@
+"""
+An item delegate that edits IP address cells with an IPAddressEdit.
+
+@author: Eddie
+"""
+
+from PyQt5 import QtWidgets, QtCore, QtGui
+
+try:
+    from .ip_address_edit import IPAddressEdit
+    from .pooled_editor_delegate import PooledEditorDelegate
+except ImportError:  # Run as a script, not from the package
+    from ip_address_edit import IPAddressEdit
+    from pooled_editor_delegate import PooledEditorDelegate
+
+
+class IPAddressEditDelegate(PooledEditorDelegate):
+    """Edit IP address cells with an IPAddressEdit.
+
+    Cells are painted as centered text, with no widget per cell. One
+    IPAddressEdit per column is created on demand and reused for every
+    edit in the column.
+
+    The address is only committed if the editor's input mask and
+    IP4Validator accept it, the same as the text an IPAddressEdit
+    accepts.
+    """
+
+    def initStyleOption(self, option: QtWidgets.QStyleOptionViewItem,
+                        index: QtCore.QModelIndex):
+        """Center the address in the cell, as in IPAddressEdit.
+
+        Parameters
+        ----------
+        option:
+            The style of the cell, which is updated.
+        index:
+            The index of the cell.
+
+        """
+        super(IPAddressEditDelegate, self).initStyleOption(option, index)
+        option.displayAlignment = QtCore.Qt.AlignCenter
+
+    def setEditorData(self, editor: IPAddressEdit,
+                      index: QtCore.QModelIndex):
+        """Set the address of the editor from the cell.
+
+        Parameters
+        ----------
+        editor:
+            The editor.
+        index:
+            The index of the cell.
+
+        """
+        address = index.data(QtCore.Qt.EditRole)
+        editor.setText('' if address is None else str(address))
+
+    def setModelData(self, editor: IPAddressEdit,
+                     model: QtCore.QAbstractItemModel,
+                     index: QtCore.QModelIndex):
+        """Set the cell from the editor, if its address is acceptable.
+
+        Parameters
+        ----------
+        editor:
+            The editor.
+        model:
+            The model of the cell.
+        index:
+            The index of the cell.
+
+        """
+        if editor.hasAcceptableInput():
+            model.setData(index, editor.text(), QtCore.Qt.EditRole)
+
+    def _create_editor(self, parent: QtWidgets.QWidget,
+                       option: QtWidgets.QStyleOptionViewItem,
+                       index: QtCore.QModelIndex) -> IPAddressEdit:
+        """Create the editor of a column.
+
+        Parameters
+        ----------
+        parent:
+            The parent of the editor, the viewport of the view.
+        option:
+            The style of the cell.
+        index:
+            The index of the cell being edited.
+
+        Returns
+        -------
+        IPAddressEdit
+            The new editor.
+
+        """
+        editor = IPAddressEdit(parent)
+        editor.setFrame(False)
+        return editor
+
+
+if __name__ == '__main__':
+    app = QtWidgets.QApplication.instance()
+    if app is None:
+        app = QtWidgets.QApplication([])
+
+    model = QtGui.QStandardItemModel(100000, 2)
+    for row in range(model.rowCount()):
+        model.setData(model.index(row, 0), 'Row {}'.format(row))
+        model.setData(model.index(row, 1),
+                      '10.0.{}.{}'.format(row // 256 % 256, row % 256))
+
+    view = QtWidgets.QTableView()
+    view.setModel(model)
+    view.setItemDelegateForColumn(1, IPAddressEditDelegate(view))
+    view.setColumnWidth(1, 150)
+    model.dataChanged.connect(
+        lambda index, *_: print(index.row(), index.data())
+        )
+    view.show()
+
+    app.exec()
@@ -0,0 +1,1363 @@
+"""
+A slider with any number of handles.
+
+@author: Eddie
+"""
+
+import bisect
+import decimal
+import math
+import numbers
+from typing import (Callable, Iterable, List, NamedTuple, Optional, Tuple,
+                    Union)
+
+from PyQt5 import QtWidgets, QtGui, QtCore
+
+#: The type of the values of a multi slider.
+Number = Union[int, float]
+
+#: The largest range the underlying QSlider can represent.
+_QT_MAX_RANGE = 2**31 - 1
+
+
+class _SliderGeometry(NamedTuple):
+    """Style geometry of a slider, cached between geometry changes."""
+
+    #: The rectangle of the groove.
+    groove: QtCore.QRect
+    #: The rectangle of a handle sitting at the start of the groove.
+    handle: QtCore.QRect
+    #: The length of a handle along the slider's orientation.
+    slider_length: int
+    #: The first pixel a handle can be positioned at.
+    slider_min: int
+    #: The last pixel a handle can be positioned at.
+    slider_max: int
+    #: Whether the minimum is drawn at the end of the groove.
+    upside_down: bool
+
+    @property
+    def span(self) -> int:
+        """The number of pixels a handle can travel."""
+        return self.slider_max - self.slider_min
+
+
+class MultiSlider(QtWidgets.QSlider):
+    """A slider with any number of handles.
+
+    This class provides a slider where there is a defined maximum and
+    minimum, as is a normal slider, but instead of having a single slider
+    value, there is a sorted list of values, one per handle. Handles can't
+    pass each other, so the values stay sorted.
+
+    The values are not limited to the 32-bit int range of QSlider. If the
+    minimum, maximum and resolution are all ints, the values are arbitrary
+    size ints, such as int64 nanosecond timestamps. If any of them are
+    floats, the values are floats snapped to multiples of the resolution
+    from the minimum.
+
+    The pixel position of each handle is cached, so hit-testing a click
+    is a binary search and painting only draws the handles in the exposed
+    area, one per pixel position. The groove and tick marks are drawn once
+    into a pixmap, which is reused until the size, range, tick settings,
+    palette or style change.
+
+    Only part of the range can be made visible, in which case the handles
+    and tick marks are laid out over that part of the range only. Values
+    outside it are kept, but their handles aren't drawn.
+
+    With tick decimation on, the tick marks are drawn by the slider rather
+    than the style, at "nice" minor and major intervals chosen so there is
+    at most one tick every few pixels, however large the range is. They
+    are also decimated whenever the style would draw more tick marks than
+    there are pixels along the groove.
+
+    This class emits the same signals as the QSlider base class, as well as
+    the values_moved signal. How often values_moved is emitted while
+    dragging is controlled by the emission policy, but the final values of
+    a drag are always emitted.
+    """
+
+    #: Signal emitted when the handles are moved, with the list of values.
+    values_moved = QtCore.pyqtSignal(list)
+
+    #: Emission policy: emit on every mouse move.
+    EmitImmediate = 0
+    #: Emission policy: emit at most at the emission rate.
+    EmitThrottled = 1
+    #: Emission policy: emit once the pointer pauses.
+    EmitDebounced = 2
+    #: Emission policy: emit only when the handle is released.
+    EmitOnRelease = 3
+
+    def __init__(self, *args, **kwargs):
+        """Initialize the slider.
+
+        Initializes the multi slider, with no handles.
+
+        """
+        super(MultiSlider, self).__init__(*args, **kwargs)
+
+        # The value domain is kept here rather than in the QSlider, which
+        # only holds the 32-bit step range used to draw with the style.
+        self._minimum = super(MultiSlider, self).minimum()
+        self._maximum = super(MultiSlider, self).maximum()
+        self._resolution = 1
+        self._steps = self._maximum - self._minimum
+        self._step_scale = 1
+
+        # The visible part of the range, as (minimum, maximum) values or
+        # None for the whole range, and as steps from the minimum.
+        self._visible_range: Optional[Tuple[Number, Number]] = None
+        self._view_start = 0
+        self._view_steps = self._steps
+        self._decimals = 0
+        self._tick_interval = 0
+        self._tick_decimation = False
+        self._minimum_tick_spacing = 4
+
+        # The sorted values of the handles, and their cached positions
+        # along the groove, in pixels from the minimum end.
+        self._values: List[Number] = []
+        self._positions: Optional[List[int]] = None
+
+        self.pressed_control = QtWidgets.QStyle.SC_None
+        self.hover_control = QtWidgets.QStyle.SC_None
+        self.click_offset = 0
+
+        # The index of the handle being dragged, -1 for all of them
+        self.active_slider = 0
+
+        # The style geometry is only recomputed when the size, range,
+        # orientation or style changes, not on every mouse event.
+        self._geometry: Optional[_SliderGeometry] = None
+
+        # The groove and tick marks, drawn once and reused on each repaint.
+        self._background: Optional[QtGui.QPixmap] = None
+
+        # The area covered by handles before and after they moved, which
+        # is all that needs repainting.
+        self._dirty_region = QtGui.QRegion()
+
+        # Control how often the values are emitted during a drag.
+        self._emission_policy = self.EmitImmediate
+        self._emission_rate = 30.0
+        self._debounce_interval = 150
+        self._emit_pending = False
+        self._emit_timer = QtCore.QTimer(self)
+        self._emit_timer.setSingleShot(True)
+        self._emit_timer.timeout.connect(self._on_emit_timeout)
+
+    def values(self) -> List[Number]:
+        """Get the values of the handles.
+
+        Returns
+        -------
+        List[Number]
+            The sorted values of the handles.
+
+        """
+        return list(self._values)
+
+    def set_values(self, values: Iterable[Number]):
+        """Set the values of the handles.
+
+        The number of handles is set to the number of values. The values
+        are snapped to the resolution and sorted.
+
+        Parameters
+        ----------
+        values:
+            The new values of the handles.
+
+        """
+        self._values = sorted(self._snap(value) for value in values)
+        self._positions = None
+        self.update()
+
+    def handle_count(self) -> int:
+        """Get the number of handles.
+
+        Returns
+        -------
+        int
+            The number of handles.
+
+        """
+        return len(self._values)
+
+    def value_at(self, index: int) -> Number:
+        """Get the value of a handle.
+
+        Parameters
+        ----------
+        index:
+            The index of the handle.
+
+        Returns
+        -------
+        Number
+            The value of the handle.
+
+        """
+        return self._values[index]
+
+    def set_value_at(self, index: int, value: Number):
+        """Set the value of a handle.
+
+        The value is snapped to the resolution. Any neighbouring handles
+        it passes are pushed along with it, so the values stay sorted.
+
+        Parameters
+        ----------
+        index:
+            The index of the handle.
+        value:
+            The new value of the handle.
+
+        """
+        value = self._snap(value)
+        self._set_value(index, value)
+
+        for i in range(index + 1, len(self._values)):
+            if self._values[i] >= value:
+                break
+            self._set_value(i, value)
+
+        for i in range(index - 1, -1, -1):
+            if self._values[i] <= value:
+                break
+            self._set_value(i, value)
+
+        self._update_dirty()
+
+    def add_value(self, value: Number) -> int:
+        """Add a handle.
+
+        Parameters
+        ----------
+        value:
+            The value of the new handle.
+
+        Returns
+        -------
+        int
+            The index of the new handle.
+
+        """
+        value = self._snap(value)
+        index = bisect.bisect_right(self._values, value)
+        self._values.insert(index, value)
+        if self._positions is not None:
+            self._positions.insert(index, self._logical_pos(value))
+        self._mark_handle_dirty(index)
+        self._update_dirty()
+        return index
+
+    def remove_value(self, index: int):
+        """Remove a handle.
+
+        Parameters
+        ----------
+        index:
+            The index of the handle to remove.
+
+        """
+        self._mark_handle_dirty(index)
+        del self._values[index]
+        if self._positions is not None:
+            del self._positions[index]
+        self._update_dirty()
+
+    def minimum(self) -> Number:
+        """Get the minimum value of the slider.
+
+        Returns
+        -------
+        Number
+            The minimum value of the slider.
+
+        """
+        return self._minimum
+
+    def setMinimum(self, minimum: Number):
+        """Set the minimum value of the slider.
+
+        Parameters
+        ----------
+        minimum:
+            The new minimum value of the slider.
+
+        """
+        self.setRange(minimum, max(minimum, self._maximum))
+
+    def maximum(self) -> Number:
+        """Get the maximum value of the slider.
+
+        Returns
+        -------
+        Number
+            The maximum value of the slider.
+
+        """
+        return self._maximum
+
+    def setMaximum(self, maximum: Number):
+        """Set the maximum value of the slider.
+
+        Parameters
+        ----------
+        maximum:
+            The new maximum value of the slider.
+
+        """
+        self.setRange(min(self._minimum, maximum), maximum)
+
+    def setRange(self, minimum: Number, maximum: Number):
+        """Set the minimum and maximum values of the slider.
+
+        The values of the handles are clamped to the new range.
+
+        Parameters
+        ----------
+        minimum:
+            The new minimum value of the slider.
+        maximum:
+            The new maximum value of the slider.
+
+        """
+        self._minimum = minimum
+        self._maximum = max(minimum, maximum)
+        self._update_steps()
+
+    def resolution(self) -> Number:
+        """Get the resolution of the slider values.
+
+        Returns
+        -------
+        Number
+            The smallest difference between two values of the slider.
+
+        """
+        return self._resolution
+
+    def set_resolution(self, resolution: Number):
+        """Set the resolution of the slider values.
+
+        The values of the slider are snapped to multiples of the resolution
+        from the minimum. An int resolution with an int range keeps the
+        values as ints, a float resolution makes them floats.
+
+        Parameters
+        ----------
+        resolution:
+            The smallest difference between two values of the slider.
+
+        """
+        if resolution <= 0:
+            raise ValueError('The resolution must be positive.')
+        self._resolution = resolution
+        self._update_steps()
+
+    def visible_range(self) -> Tuple[Number, Number]:
+        """Get the visible part of the range of the slider.
+
+        Returns
+        -------
+        Tuple[Number, Number]
+            The minimum and maximum visible values.
+
+        """
+        return (self._from_steps(self._view_start),
+                self._from_steps(self._view_start + self._view_steps))
+
+    def set_visible_range(self, minimum: Optional[Number] = None,
+                          maximum: Optional[Number] = None):
+        """Set the visible part of the range of the slider.
+
+        The handles and tick marks are laid out over the visible range
+        only, so a small part of a large range can be picked precisely.
+
+        Parameters
+        ----------
+        minimum:
+            The minimum visible value. If None, the minimum of the slider.
+        maximum:
+            The maximum visible value. If None, the maximum of the slider.
+
+        """
+        if minimum is None and maximum is None:
+            self._visible_range = None
+        else:
+            self._visible_range = (
+                self._minimum if minimum is None else minimum,
+                self._maximum if maximum is None else maximum,
+                )
+        self._update_view()
+
+    def tickInterval(self) -> Number:
+        """Get the interval between tick marks.
+
+        Returns
+        -------
+        Number
+            The interval between tick marks, in slider values.
+
+        """
+        return self._tick_interval
+
+    def setTickInterval(self, interval: Number):
+        """Set the interval between tick marks.
+
+        Parameters
+        ----------
+        interval:
+            The interval between tick marks, in slider values. If 0, the
+            style picks the interval.
+
+        """
+        self._tick_interval = interval
+        self._update_tick_interval()
+
+    def tick_decimation(self) -> bool:
+        """Get whether the tick marks are decimated.
+
+        Returns
+        -------
+        bool
+            Whether the tick marks are decimated.
+
+        """
+        return self._tick_decimation
+
+    def set_tick_decimation(self, decimation: bool):
+        """Set whether the tick marks are decimated.
+
+        When decimated, the tick marks are spaced at least the minimum tick
+        spacing apart, at automatically chosen minor and major intervals.
+        The tick interval is only used if it's coarser than that.
+
+        Parameters
+        ----------
+        decimation:
+            Whether the tick marks are decimated.
+
+        """
+        self._tick_decimation = decimation
+        self._invalidate_background()
+        self.update()
+
+    def minimum_tick_spacing(self) -> int:
+        """Get the minimum spacing of decimated tick marks.
+
+        Returns
+        -------
+        int
+            The minimum spacing between tick marks (pixels).
+
+        """
+        return self._minimum_tick_spacing
+
+    def set_minimum_tick_spacing(self, spacing: int):
+        """Set the minimum spacing of decimated tick marks.
+
+        Parameters
+        ----------
+        spacing:
+            The minimum spacing between tick marks (pixels).
+
+        """
+        if spacing <= 0:
+            raise ValueError('The tick spacing must be positive.')
+        self._minimum_tick_spacing = spacing
+        self._invalidate_background()
+        self.update()
+
+    def paintEvent(self, event: QtGui.QPaintEvent):
+        """Paint the slider object.
+
+        Runs when the object is drawn. The cached groove and tick marks are
+        drawn, then only the handles in the exposed area are drawn. Handles
+        on the same pixel are only drawn once.
+
+        Parameters
+        ----------
+        event:
+            The event object.
+
+        """
+        painter = QtGui.QPainter(self)
+        painter.drawPixmap(0, 0, self._background_pixmap())
+        self._paint_handles(painter, event.rect())
+
+    def mousePressEvent(self, event: QtGui.QMouseEvent):
+        """Add new interactions on mouse clicks.
+
+        Add new interactions for the multi slider based on where the user
+        clicks on the slider.
+
+        Parameters
+        ----------
+        event:
+            The event object.
+
+        """
+        event.accept()
+
+        button = event.button()
+
+        # In a normal slider control, when the user clicks on a point in the
+        # slider's total range, but not on the slider part of the
+        # control would jump the slider value to where the user clicked.
+        # For this control, clicks which are not direct hits will slide all
+        # slider parts
+
+        if button:
+            self.active_slider = self._hit_test(event.pos())
+            self.click_offset = self._pixel_pos_to_range_value(
+                    self._pick(event.pos())
+                    )
+
+            if self.active_slider >= 0:
+                self.pressed_control = QtWidgets.QStyle.SC_SliderHandle
+
+                self.triggerAction(self.SliderMove)
+                self.setRepeatAction(self.SliderNoAction)
+                self.setSliderDown(True)
+            else:
+                self.pressed_control = QtWidgets.QStyle.SC_SliderHandle
+                self.triggerAction(self.SliderMove)
+                self.setRepeatAction(self.SliderNoAction)
+        else:
+            event.ignore()
+
+    def mouseMoveEvent(self, event: QtGui.QMouseEvent):
+        """Add new interactions on mouse moves for click and drag.
+
+        Add new interactions for the multi slider based on where the user
+        clicked on the slider and drags.
+
+        Parameters
+        ----------
+        event:
+            The event object.
+
+        """
+        if self.pressed_control != QtWidgets.QStyle.SC_SliderHandle:
+            event.ignore()
+            return
+
+        event.accept()
+        new_pos = self._pixel_pos_to_range_value(self._pick(event.pos()))
+
+        if not self._values:
+            pass
+        elif self.active_slider < 0:
+            offset = new_pos - self.click_offset
+            if self._values[0] + offset < self._minimum:
+                offset = self._minimum - self._values[0]
+            if self._values[-1] + offset > self._maximum:
+                offset = self._maximum - self._values[-1]
+            for i, value in enumerate(self._values):
+                self._set_value(i, self._snap(value + offset))
+        else:
+            # Of handles stacked on the same value, drag the outermost one
+            # in the direction the pointer moves, so stacked handles
+            # separate.
+            i = self.active_slider
+            value = self._values[i]
+            if new_pos > self.click_offset:
+                while (i < len(self._values) - 1
+                       and self._values[i + 1] == value):
+                    i += 1
+            elif new_pos < self.click_offset:
+                while i > 0 and self._values[i - 1] == value:
+                    i -= 1
+            self.active_slider = i
+
+            # Handles can't pass their neighbours
+            if i > 0 and new_pos <= self._values[i - 1]:
+                new_pos = self._values[i - 1] + self._resolution
+            if (i < len(self._values) - 1
+                    and new_pos >= self._values[i + 1]):
+                new_pos = self._values[i + 1] - self._resolution
+            self._set_value(i, self._snap(new_pos))
+
+        self.click_offset = new_pos
+
+        self._update_dirty()
+
+        self._request_emit()
+
+    def mouseReleaseEvent(self, event: QtGui.QMouseEvent):
+        """Deliver the final value of a drag.
+
+        Parameters
+        ----------
+        event:
+            The event object.
+
+        """
+        super(MultiSlider, self).mouseReleaseEvent(event)
+        self.pressed_control = QtWidgets.QStyle.SC_None
+        self._emit_timer.stop()
+        if self._emit_pending:
+            self._emit_slider_moved()
+
+    def emission_policy(self) -> int:
+        """Get the policy for emitting the values while dragging.
+
+        Returns
+        -------
+        int
+            One of EmitImmediate, EmitThrottled, EmitDebounced or
+            EmitOnRelease.
+
+        """
+        return self._emission_policy
+
+    def set_emission_policy(self, policy: int):
+        """Set the policy for emitting the values while dragging.
+
+        Parameters
+        ----------
+        policy:
+            One of EmitImmediate, EmitThrottled, EmitDebounced or
+            EmitOnRelease.
+
+        """
+        if policy not in (self.EmitImmediate, self.EmitThrottled,
+                          self.EmitDebounced, self.EmitOnRelease):
+            raise ValueError('Unknown emission policy: {}'.format(policy))
+
+        self._emission_policy = policy
+        self._emit_timer.stop()
+        if self._emit_pending:
+            self._emit_slider_moved()
+
+    def emission_rate(self) -> float:
+        """Get the maximum rate the values are emitted at when throttled.
+
+        Returns
+        -------
+        float
+            The maximum emission rate (Hz).
+
+        """
+        return self._emission_rate
+
+    def set_emission_rate(self, rate: float):
+        """Set the maximum rate the values are emitted at when throttled.
+
+        Parameters
+        ----------
+        rate:
+            The maximum emission rate (Hz).
+
+        """
+        if rate <= 0:
+            raise ValueError('The emission rate must be positive.')
+        self._emission_rate = rate
+
+    def debounce_interval(self) -> int:
+        """Get how long the pointer must pause before emitting when debounced.
+
+        Returns
+        -------
+        int
+            The debounce interval (milliseconds).
+
+        """
+        return self._debounce_interval
+
+    def set_debounce_interval(self, interval: int):
+        """Set how long the pointer must pause before emitting when debounced.
+
+        Parameters
+        ----------
+        interval:
+            The debounce interval (milliseconds).
+
+        """
+        self._debounce_interval = interval
+
+    def resizeEvent(self, event: QtGui.QResizeEvent):
+        """Invalidate the cached geometry when the slider is resized.
+
+        Parameters
+        ----------
+        event:
+            The event object.
+
+        """
+        super(MultiSlider, self).resizeEvent(event)
+        self._invalidate_geometry()
+
+    def changeEvent(self, event: QtCore.QEvent):
+        """Invalidate the cached drawing when the style or palette changes.
+
+        Parameters
+        ----------
+        event:
+            The event object.
+
+        """
+        super(MultiSlider, self).changeEvent(event)
+        if event.type() in (QtCore.QEvent.StyleChange,
+                            QtCore.QEvent.LayoutDirectionChange):
+            self._invalidate_geometry()
+        elif event.type() in (QtCore.QEvent.PaletteChange,
+                              QtCore.QEvent.EnabledChange,
+                              QtCore.QEvent.ActivationChange):
+            self._invalidate_background()
+
+    def sliderChange(self, change: QtWidgets.QAbstractSlider.SliderChange):
+        """Invalidate the cached geometry when the range or orientation
+        changes.
+
+        Parameters
+        ----------
+        change:
+            The kind of change made to the slider.
+
+        """
+        super(MultiSlider, self).sliderChange(change)
+        if change in (self.SliderRangeChange, self.SliderOrientationChange):
+            self._invalidate_geometry()
+
+    def setInvertedAppearance(self, inverted: bool):
+        """Set whether the slider is drawn inverted.
+
+        Parameters
+        ----------
+        inverted:
+            Whether the minimum is drawn at the end of the groove.
+
+        """
+        super(MultiSlider, self).setInvertedAppearance(inverted)
+        self._invalidate_geometry()
+
+    def setTickPosition(self, position: QtWidgets.QSlider.TickPosition):
+        """Set the position of the tick marks.
+
+        Parameters
+        ----------
+        position:
+            The new position of the tick marks.
+
+        """
+        super(MultiSlider, self).setTickPosition(position)
+        self._invalidate_geometry()
+
+    def _set_value(self, index: int, value: Number):
+        """Set the value of a handle and its cached position.
+
+        The handle's old and new rects are added to the dirty region.
+        """
+        if self._values[index] == value:
+            return
+
+        self._mark_handle_dirty(index)
+        self._values[index] = value
+        if self._positions is not None:
+            self._positions[index] = self._logical_pos(value)
+        self._mark_handle_dirty(index)
+
+    def _mark_handle_dirty(self, index: int):
+        """Add the rect of a handle to the dirty region.
+
+        Parameters
+        ----------
+        index:
+            The index of the handle.
+
+        """
+        if self.isVisible():
+            # Leave room for any shadow or focus frame the style draws
+            # around the handle.
+            rect = self._handle_rect(self._values[index])
+            self._dirty_region += rect.adjusted(-2, -2, 2, 2)
+
+    def _update_dirty(self):
+        """Repaint the dirty region and clear it."""
+        if not self._dirty_region.isEmpty():
+            self.update(self._dirty_region)
+            self._dirty_region = QtGui.QRegion()
+
+    def _update_steps(self):
+        """Update the number of resolution steps after a domain change."""
+        if self._is_int_domain():
+            self._steps = ((int(self._maximum) - int(self._minimum))
+                           // int(self._resolution))
+        else:
+            self._steps = round(
+                (self._maximum - self._minimum) / self._resolution
+                )
+            # Float values are rounded to the decimals of the minimum and
+            # resolution, so they don't pick up float noise.
+            self._decimals = max(
+                -decimal.Decimal(str(value)).as_tuple().exponent
+                for value in (self._minimum, self._resolution)
+                )
+
+        self._values = [self._snap(value) for value in self._values]
+        self._update_view()
+
+    def _update_view(self):
+        """Update the step range of the QSlider after a view change.
+
+        The QSlider range is set to the number of resolution steps in the
+        visible range, scaled down to fit in 32 bits, which is what the
+        style draws the handles and tick marks with.
+        """
+        if self._visible_range is None:
+            self._view_start = 0
+            self._view_steps = self._steps
+        else:
+            self._view_start = self._to_steps(self._visible_range[0])
+            self._view_steps = max(
+                0, self._to_steps(self._visible_range[1]) - self._view_start
+                )
+        self._step_scale = max(1, math.ceil(self._view_steps / _QT_MAX_RANGE))
+
+        super(MultiSlider, self).setRange(
+            0, self._view_steps // self._step_scale
+            )
+        self._update_tick_interval()
+        self._invalidate_geometry()
+        self.update()
+
+    def _update_tick_interval(self):
+        """Set the tick interval of the QSlider in steps."""
+        steps = 0
+        if self._tick_interval > 0:
+            steps = max(1, round(self._tick_interval / self._resolution
+                                 / self._step_scale))
+        super(MultiSlider, self).setTickInterval(steps)
+        self._invalidate_background()
+
+    def _is_int_domain(self) -> bool:
+        """Get whether the values of the slider are ints."""
+        return all(isinstance(value, numbers.Integral) for value in
+                   (self._minimum, self._maximum, self._resolution))
+
+    def _to_steps(self, value: Number) -> int:
+        """Convert a value to the number of steps from the minimum."""
+        if (self._is_int_domain()
+                and isinstance(value, numbers.Integral)):
+            resolution = int(self._resolution)
+            steps = ((int(value) - int(self._minimum) + resolution // 2)
+                     // resolution)
+        else:
+            steps = round((value - self._minimum) / self._resolution)
+        return min(max(steps, 0), self._steps)
+
+    def _from_steps(self, steps: int) -> Number:
+        """Convert a number of steps from the minimum to a value."""
+        if steps >= self._steps:
+            return self._maximum
+
+        value = self._minimum + max(steps, 0) * self._resolution
+        if not self._is_int_domain():
+            value = round(value, self._decimals)
+        return value
+
+    def _snap(self, value: Number) -> Number:
+        """Snap a value to the resolution and clamp it to the range."""
+        return self._from_steps(self._to_steps(value))
+
+    def _request_emit(self):
+        """Emit the values now or later, based on the emission policy."""
+        self._emit_pending = True
+
+        if self._emission_policy == self.EmitImmediate:
+            self._emit_slider_moved()
+        elif self._emission_policy == self.EmitThrottled:
+            # Emit the first move right away, then at most once per period
+            # with whatever the latest value is when the period ends.
+            if not self._emit_timer.isActive():
+                self._emit_slider_moved()
+                self._emit_timer.start(int(1000 / self._emission_rate))
+        elif self._emission_policy == self.EmitDebounced:
+            self._emit_timer.start(self._debounce_interval)
+
+    def _on_emit_timeout(self):
+        """Emit the latest value once the throttle or debounce timer fires."""
+        if self._emit_pending:
+            self._emit_slider_moved()
+            if self._emission_policy == self.EmitThrottled:
+                self._emit_timer.start(int(1000 / self._emission_rate))
+
+    def _emit_slider_moved(self):
+        """Emit the current values."""
+        self._emit_pending = False
+        self.values_moved.emit(list(self._values))
+
+    def _invalidate_geometry(self):
+        """Drop the cached geometry so it's recomputed on next use."""
+        self._geometry = None
+        self._positions = None
+        self._invalidate_background()
+
+    def _invalidate_background(self):
+        """Drop the cached groove and tick marks so they're redrawn."""
+        self._background = None
+
+    def _background_pixmap(self) -> QtGui.QPixmap:
+        """Get the groove and tick marks, drawing them if needed.
+
+        The pixmap is drawn at the device pixel ratio of the screen the
+        slider is on, so it's redrawn if the slider moves to a screen with
+        a different ratio.
+
+        Returns
+        -------
+        QtGui.QPixmap
+            The cached groove and tick marks, the size of the slider.
+
+        """
+        if (self._background is None
+                or self._background.devicePixelRatioF()
+                != self.devicePixelRatioF()):
+            self._background = self._render_pixmap(self._paint_background)
+
+        return self._background
+
+    def _render_pixmap(self, paint: Callable[[QtGui.QPainter], None]
+                       ) -> QtGui.QPixmap:
+        """Draw into a transparent pixmap the size of the slider.
+
+        Parameters
+        ----------
+        paint:
+            The function that draws into the pixmap with a painter.
+
+        Returns
+        -------
+        QtGui.QPixmap
+            The pixmap, at the device pixel ratio of the slider.
+
+        """
+        ratio = self.devicePixelRatioF()
+        pixmap = QtGui.QPixmap(self.size() * ratio)
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(QtCore.Qt.transparent)
+
+        painter = QtGui.QPainter(pixmap)
+        paint(painter)
+        painter.end()
+
+        return pixmap
+
+    def _paint_background(self, painter: QtGui.QPainter):
+        """Draw the groove and tick marks.
+
+        Parameters
+        ----------
+        painter:
+            The painter to draw with.
+
+        """
+        style = QtWidgets.QApplication.style()
+
+        opt = QtWidgets.QStyleOptionSlider()
+        self.initStyleOption(opt)
+
+        opt.subControls = QtWidgets.QStyle.SC_SliderGroove
+        if self.tickPosition() == self.NoTicks:
+            pass
+        elif self._tick_decimation or not self._style_ticks_fit():
+            self._paint_decimated_ticks(painter)
+        else:
+            opt.subControls |= QtWidgets.QStyle.SC_SliderTickmarks
+        style.drawComplexControl(
+                QtWidgets.QStyle.CC_Slider, opt, painter, self
+                )
+
+    def _paint_handles(self, painter: QtGui.QPainter, rect: QtCore.QRect):
+        """Draw the handles intersecting a rectangle.
+
+        Parameters
+        ----------
+        painter:
+            The painter to draw with.
+        rect:
+            The area being painted.
+
+        """
+        style = QtWidgets.QApplication.style()
+
+        opt = QtWidgets.QStyleOptionSlider()
+        self.initStyleOption(opt)
+
+        opt.subControls = QtWidgets.QStyle.SC_SliderHandle
+        if self.pressed_control:
+            opt.activeSubControls = self.pressed_control
+            opt.state |= QtWidgets.QStyle.State_Sunken
+        else:
+            opt.activeSubControls = self.hover_control
+
+        first, last = self._visible_handles(rect)
+        positions = self._handle_positions()
+        for i in range(first, last):
+            # A later handle on the same pixel would be drawn on top anyway
+            if i + 1 < last and positions[i + 1] == positions[i]:
+                continue
+
+            opt.sliderPosition = (
+                (self._to_steps(self._values[i]) - self._view_start)
+                // self._step_scale
+                )
+            opt.sliderValue = opt.sliderPosition
+            style.drawComplexControl(
+                    QtWidgets.QStyle.CC_Slider, opt, painter, self
+                    )
+
+    def _paint_decimated_ticks(self, painter: QtGui.QPainter):
+        """Draw the tick marks at decimated intervals.
+
+        The number of tick marks drawn depends on the length of the groove,
+        not the size of the range.
+
+        Parameters
+        ----------
+        painter:
+            The painter to draw with.
+
+        """
+        geometry = self._slider_geometry()
+        span = geometry.span
+        minimum, maximum = self.visible_range()
+        if span <= 0 or maximum <= minimum:
+            return
+
+        smallest = (maximum - minimum) * self._minimum_tick_spacing / span
+        minor, major = self._tick_intervals(max(smallest, self._resolution))
+
+        # The bands between the handles and the edges of the slider
+        handle = geometry.handle
+        horizontal = self.orientation() == QtCore.Qt.Horizontal
+        if horizontal:
+            bands = [(0, handle.top()), (handle.bottom() + 1, self.height())]
+        else:
+            bands = [(0, handle.left()), (handle.right() + 1, self.width())]
+        if not self.tickPosition() & self.TicksAbove:
+            bands[0] = None
+        if not self.tickPosition() & self.TicksBelow:
+            bands[1] = None
+
+        # Count the ticks in multiples of the minor interval, so float
+        # intervals don't accumulate errors.
+        ratio = 1 if major is None else round(major / minor)
+        lines = []
+        for i in range(int(-(-minimum // minor)), int(maximum // minor) + 1):
+            pos = self._range_value_to_pixel_pos(i * minor)
+            pos += geometry.slider_length // 2
+            is_major = i % ratio == 0
+
+            for j, band in enumerate(bands):
+                if band is None:
+                    continue
+                start, end = band
+                if not is_major:
+                    # Minor ticks are half as long, from the groove side
+                    if j == 0:
+                        start = (start + end) // 2
+                    else:
+                        end = (start + end) // 2
+                if horizontal:
+                    lines.append(QtCore.QLineF(pos, start, pos, end - 1))
+                else:
+                    lines.append(QtCore.QLineF(start, pos, end - 1, pos))
+
+        painter.save()
+        painter.setPen(QtGui.QPen(self.palette().windowText(), 1))
+        painter.drawLines(lines)
+        painter.restore()
+
+    def _style_ticks_fit(self) -> bool:
+        """Get whether the style's tick marks fit along the groove.
+
+        The style draws one tick mark per tick interval of the QSlider
+        range, or per page step if there is no interval, so a wide range
+        would draw far more tick marks than there are pixels.
+
+        Returns
+        -------
+        bool
+            Whether there are no more tick marks than pixels.
+
+        """
+        interval = super(MultiSlider, self).tickInterval()
+        if interval <= 0:
+            interval = self.pageStep()
+        ticks = super(MultiSlider, self).maximum() // max(interval, 1)
+        return ticks <= self._slider_geometry().span
+
+    def _tick_intervals(self, smallest: Number) -> Tuple[Number,
+                                                         Optional[Number]]:
+        """Get the minor and major intervals of decimated tick marks.
+
+        Parameters
+        ----------
+        smallest:
+            The smallest interval that keeps the tick marks at least the
+            minimum tick spacing apart.
+
+        Returns
+        -------
+        Tuple[Number, Optional[Number]]
+            The minor and major tick intervals. The major interval is None
+            if all tick marks are major.
+
+        """
+        if self._tick_interval >= smallest:
+            return self._tick_interval, None
+        return _decimal_tick_intervals(smallest)
+
+    def _slider_geometry(self) -> _SliderGeometry:
+        """Get the style geometry of the slider, computing it if needed.
+
+        Returns
+        -------
+        _SliderGeometry
+            The cached geometry of the slider.
+
+        """
+        if self._geometry is None:
+            opt = QtWidgets.QStyleOptionSlider()
+            self.initStyleOption(opt)
+            style = QtWidgets.QApplication.style()
+
+            groove = style.subControlRect(
+                    style.CC_Slider, opt, style.SC_SliderGroove, self
+                    )
+
+            # Get the handle at the start of the groove, so any other handle
+            # rect is just a translation of it.
+            opt.sliderPosition = opt.minimum
+            opt.upsideDown = False
+            handle = style.subControlRect(
+                    style.CC_Slider, opt, style.SC_SliderHandle, self
+                    )
+
+            if self.orientation() == QtCore.Qt.Horizontal:
+                slider_length = handle.width()
+                slider_min = groove.x()
+                slider_max = groove.right() - slider_length + 1
+            else:
+                slider_length = handle.height()
+                slider_min = groove.y()
+                slider_max = groove.bottom() - slider_length + 1
+
+            self.initStyleOption(opt)
+            self._geometry = _SliderGeometry(
+                groove=groove,
+                handle=handle,
+                slider_length=slider_length,
+                slider_min=slider_min,
+                slider_max=slider_max,
+                upside_down=opt.upsideDown,
+            )
+
+        return self._geometry
+
+    def _handle_positions(self) -> List[int]:
+        """Get the cached positions of the handles, computing them if needed.
+
+        Returns
+        -------
+        List[int]
+            The sorted positions of the handles along the groove, in pixels
+            from the minimum end.
+
+        """
+        if self._positions is None:
+            self._positions = [self._logical_pos(value)
+                               for value in self._values]
+        return self._positions
+
+    def _visible_handles(self, rect: QtCore.QRect) -> Tuple[int, int]:
+        """Get the range of handles intersecting a rectangle.
+
+        Parameters
+        ----------
+        rect:
+            The rectangle to find the handles in.
+
+        Returns
+        -------
+        Tuple[int, int]
+            The index of the first handle and one past the last handle
+            intersecting the rectangle.
+
+        """
+        geometry = self._slider_geometry()
+        positions = self._handle_positions()
+
+        if self.orientation() == QtCore.Qt.Horizontal:
+            start, end = rect.left(), rect.right()
+        else:
+            start, end = rect.top(), rect.bottom()
+
+        # Convert the pixel interval to the positions of the handles whose
+        # rects overlap it.
+        start -= geometry.slider_min + geometry.slider_length - 1
+        end -= geometry.slider_min
+        if geometry.upside_down:
+            start, end = geometry.span - end, geometry.span - start
+
+        # Handles outside the visible range aren't shown
+        start = max(start, 0)
+        end = min(end, geometry.span)
+
+        return (bisect.bisect_left(positions, start),
+                bisect.bisect_right(positions, end))
+
+    def _hit_test(self, pt: QtCore.QPoint) -> int:
+        """Get the handle under a point.
+
+        Parameters
+        ----------
+        pt:
+            The point to test.
+
+        Returns
+        -------
+        int
+            The index of the handle under the point, or -1 if there is
+            none. If handles overlap, the closest one to the point is used.
+
+        """
+        geometry = self._slider_geometry()
+        handle = geometry.handle
+
+        if self.orientation() == QtCore.Qt.Horizontal:
+            hit = handle.top() <= pt.y() <= handle.bottom()
+        else:
+            hit = handle.left() <= pt.x() <= handle.right()
+        if not hit:
+            return -1
+
+        first, last = self._visible_handles(QtCore.QRect(pt, pt))
+        positions = self._handle_positions()
+
+        # Distance from the point to the centre of the handle, in pixels
+        # from the minimum end.
+        pos = self._pick(pt) - geometry.slider_min
+        if geometry.upside_down:
+            pos = geometry.span - pos + geometry.slider_length
+        pos -= geometry.slider_length / 2
+
+        closest, closest_distance = -1, 0
+        for i in range(first, last):
+            distance = abs(positions[i] - pos)
+            if closest < 0 or distance < closest_distance:
+                closest, closest_distance = i, distance
+        return closest
+
+    def _handle_rect(self, value: Number) -> QtCore.QRect:
+        """Get the rectangle of a handle at a given value.
+
+        Parameters
+        ----------
+        value:
+            The value of the handle.
+
+        Returns
+        -------
+        QtCore.QRect
+            The rectangle the handle is drawn in.
+
+        """
+        geometry = self._slider_geometry()
+        pos = self._range_value_to_pixel_pos(value)
+        rect = QtCore.QRect(geometry.handle)
+
+        if self.orientation() == QtCore.Qt.Horizontal:
+            rect.moveLeft(pos)
+        else:
+            rect.moveTop(pos)
+        return rect
+
+    def _pick(self, pt: QtCore.QPoint) -> int:
+        if self.orientation() == QtCore.Qt.Horizontal:
+            return pt.x()
+        else:
+            return pt.y()
+
+    def _logical_pos(self, value: Number) -> int:
+        """Get the position of a value in pixels from the minimum visible
+        end."""
+        span = self._slider_geometry().span
+
+        if self._view_steps <= 0 or span <= 0:
+            return 0
+
+        # Same rounding as QStyle.sliderPositionFromValue, but exact for
+        # any size of int.
+        steps = self._to_steps(value) - self._view_start
+        return ((2 * steps * span + self._view_steps)
+                // (2 * self._view_steps))
+
+    def _range_value_to_pixel_pos(self, value: Number) -> int:
+        geometry = self._slider_geometry()
+
+        pos = self._logical_pos(value)
+        if geometry.upside_down:
+            pos = geometry.span - pos
+        return geometry.slider_min + pos
+
+    def _pixel_pos_to_range_value(self, pos: int) -> Number:
+        geometry = self._slider_geometry()
+        span = geometry.span
+
+        if span <= 0:
+            return self._minimum
+
+        pos = min(max(pos - geometry.slider_min, 0), span)
+        if geometry.upside_down:
+            pos = span - pos
+
+        # Same rounding as QStyle.sliderValueFromPosition.
+        return self._from_steps(
+            self._view_start
+            + (2 * pos * self._view_steps + span) // (2 * span)
+            )
+
+
+def _decimal_tick_intervals(smallest: Number) -> Tuple[Number, Number]:
+    """Round an interval up to 1, 2 or 5 times a power of 10.
+
+    Parameters
+    ----------
+    smallest:
+        The smallest interval that keeps the tick marks apart.
+
+    Returns
+    -------
+    Tuple[Number, Number]
+        The minor tick interval, and the major one, at the next power of
+        10 or 5 times one.
+
+    """
+    magnitude = 10 ** math.floor(math.log10(smallest))
+    for multiple, major in ((1, 5), (2, 10), (5, 10), (10, 50)):
+        if multiple * magnitude >= smallest:
+            return multiple * magnitude, major * magnitude
+
+
+if __name__ == "__main__":
+    app = QtWidgets.QApplication.instance()
+    if app is None:
+        app = QtWidgets.QApplication([])
+
+    slider = MultiSlider(QtCore.Qt.Horizontal)
+
+    slider.setRange(0, 255)
+    slider.set_values(range(0, 256, 16))
+    slider.setTickPosition(QtWidgets.QSlider.TicksBelow)
+    slider.setTickInterval(16)
+    slider.values_moved.connect(print)
+    slider.show()
+    app.exec()
@@ -4,10 +4,119 @@ Created on May 7, 2020
 @author: eddie
 A LineEdit class with a button on left/right side.
 """
-from typing import Optional
+import decimal
+from decimal import Decimal
+from typing import Optional, Tuple, Union
 
 from PyQt5 import QtWidgets, QtCore, QtGui
 
+try:
+    from .auto_repeat import AutoRepeat
+    from .wheel_steps import WheelSteps
+except ImportError:  # Run as a script, not from the package
+    from auto_repeat import AutoRepeat
+    from wheel_steps import WheelSteps
+
+#: The values of a PlusMinusBox, ints with no decimals and Decimals with.
+Number = Union[int, Decimal]
+
+# Decimals are rounded and added with no limit on their digits, as ints
+# are, rather than the 28 digits of the default context.
+_EXACT = decimal.Context(prec=decimal.MAX_PREC)
+
+
+class _NumberValidator(QtGui.QValidator):
+    """
+    Validate typed text as a number between optional bounds.
+
+    Unlike QIntValidator and QDoubleValidator, the bounds aren't limited to
+    32 bits or to floats, and either can be None for no bound. With no
+    decimals the text is a Python int, otherwise it's a Decimal with at most
+    that many digits after the point.
+    """
+
+    def __init__(self, parent: Optional[QtCore.QObject] = None):
+        super(_NumberValidator, self).__init__(parent)
+
+        self._bottom: Optional[Number] = None
+        self._top: Optional[Number] = None
+        self._decimals = 0
+
+    def set_range(self, bottom: Optional[Number], top: Optional[Number]):
+        """
+        Set the bounds of the acceptable values.
+
+        Parameters
+        ----------
+        bottom:
+            The bottom value, or None for no bottom.
+        top:
+            The top value, or None for no top.
+        """
+        self._bottom = bottom
+        self._top = top
+        self.changed.emit()
+
+    def set_decimals(self, decimals: int):
+        """
+        Set the number of digits allowed after the decimal point.
+
+        Parameters
+        ----------
+        decimals:
+            The number of digits after the point, 0 for ints.
+        """
+        self._decimals = decimals
+        self.changed.emit()
+
+    def validate(self, text: str, pos: int) -> Tuple[QtGui.QValidator.State,
+                                                     str, int]:
+        """
+        Validate the text typed in the box.
+
+        Text that can't become acceptable by typing more digits is invalid.
+
+        Parameters
+        ----------
+        text:
+            The text to validate.
+        pos:
+            The position of the cursor.
+
+        Returns
+        -------
+        Tuple[QtGui.QValidator.State, str, int]
+            The state of the text, the text and the position of the cursor.
+        """
+        bottom, top = self._bottom, self._top
+        stripped = text.strip()
+        digits = stripped.lstrip('+-')
+        sign = stripped[:len(stripped) - len(digits)]
+        whole, point, fraction = digits.partition('.')
+
+        number = whole + fraction
+        if (len(sign) > 1 or (point and not self._decimals)
+                or len(fraction) > self._decimals
+                or (number and not number.isdecimal())):
+            return self.Invalid, text, pos
+        negative = sign == '-'
+        if negative and bottom is not None and bottom >= 0:
+            return self.Invalid, text, pos
+        if not number:
+            return self.Intermediate, text, pos
+
+        value = Decimal(stripped) if self._decimals else int(stripped)
+        if ((bottom is None or value >= bottom)
+                and (top is None or value <= top)):
+            return self.Acceptable, text, pos
+
+        # More digits only move the value away from zero, so it can't come
+        # back within a bound it's already past.
+        if negative and bottom is not None and value < bottom or \
+                not negative and top is not None and value > top:
+            return self.Invalid, text, pos
+        return self.Intermediate, text, pos
+
 
 class PlusMinusBox(QtWidgets.QLineEdit):
     """
@@ -15,10 +124,14 @@ class PlusMinusBox(QtWidgets.QLineEdit):
 
     """
 
-    value_changed = QtCore.pyqtSignal(int)
+    #: Signal emitted with the new value, a Python int of any size, or a
+    #: Decimal if the box has decimals.
+    value_changed = QtCore.pyqtSignal(object)
 
-    def __init__(self, parent: QtWidgets.QWidget = None, minimum: int = 0,
-                 maximum: Optional[int] = None, default: int = 0):
+    def __init__(self, parent: QtWidgets.QWidget = None,
+                 minimum: Optional[Number] = 0,
+                 maximum: Optional[Number] = None, default: Number = 0,
+                 decimals: int = 0, step: Number = 1, page_step: Number = 10):
         super(PlusMinusBox, self).__init__(parent)
 
         # Create the action to toggle the echo state of the QLineEdit
@@ -29,14 +142,25 @@ class PlusMinusBox(QtWidgets.QLineEdit):
         self._rightAction.triggered.connect(self._increase)
         self.addAction(self._rightAction)
 
-        self._validator = QtGui.QIntValidator()
-        self.set_range(bottom=minimum, top=maximum)
-
+        # The bounds are numbers, or None for no bound, and are compared
+        # with the value directly. The validator only checks typed text.
+        self._bottom: Optional[Number] = minimum
+        self._top: Optional[Number] = maximum
+        self._validator = _NumberValidator(self)
         self.setValidator(self._validator)
 
+        # The values are converted and formatted with the functions for the
+        # number of decimals, made once when it's set.
+        self._decimals = 0
+        self._unit: Number = 1
+        self._convert = int
+        self._format = str
+        self._step_size: Number = step
+        self._page_step: Number = page_step
         self._value = default if minimum is None else minimum
+        self.set_decimals(decimals)
 
-        self.setText(str(self.value))
+        self.setText(self._format(self.value))
         self.setAlignment(QtCore.Qt.AlignCenter)
 
         # Create the buttons to trigger the actions
@@ -52,6 +176,36 @@ class PlusMinusBox(QtWidgets.QLineEdit):
         self._rightButton.show()
         self._rightButton.setCursor(QtCore.Qt.ArrowCursor)
 
+        # Holding a button down repeats it with a growing step. The display
+        # follows every step, but value_changed is emitted at most at the
+        # emission rate, and once more on release.
+        self._leftRepeat = AutoRepeat(self._leftButton)
+        self._leftRepeat.stepped.connect(
+            lambda steps: self._repeat_step(-steps)
+            )
+        self._leftRepeat.finished.connect(self._flush_emit)
+        self._rightRepeat = AutoRepeat(self._rightButton)
+        self._rightRepeat.stepped.connect(self._repeat_step)
+        self._rightRepeat.finished.connect(self._flush_emit)
+
+        self._emission_rate = 10.0
+        self._emit_pending = False
+        self._emit_timer = QtCore.QTimer(self)
+        self._emit_timer.setSingleShot(True)
+        self._emit_timer.timeout.connect(self._on_emit_timeout)
+
+        # Wheel deltas are added up into steps, applied once a frame. Shift
+        # on the last wheel event picks the page step.
+        self._wheel_steps = WheelSteps(self)
+        self._wheel_steps.stepped.connect(self._on_wheel_stepped)
+        self._wheel_page = False
+
+        # Typed text is parsed once per edit (a keystroke or a paste) while
+        # keyboard tracking is on, otherwise once when editing finishes.
+        self._keyboard_tracking = True
+        self.textEdited.connect(self._on_text_edited)
+        self.editingFinished.connect(self._commit_text)
+
         # Fix any sizing issues
         if not self.testAttribute(QtCore.Qt.WA_Resized):
             self.adjustSize()
@@ -66,83 +220,379 @@ class PlusMinusBox(QtWidgets.QLineEdit):
         super(PlusMinusBox, self).resizeEvent(event)
         self._set_layout()
 
+    def emission_rate(self) -> float:
+        """
+        Get the most times per second value_changed is emitted while a
+        button is held down.
+
+        Returns
+        -------
+        float
+            The emission rate (emissions per second).
+        """
+        return self._emission_rate
+
+    def set_emission_rate(self, rate: float):
+        """
+        Set the most times per second value_changed is emitted while a
+        button is held down.
+
+        Parameters
+        ----------
+        rate:
+            The emission rate (emissions per second).
+        """
+        if rate <= 0:
+            raise ValueError('The emission rate must be positive.')
+        self._emission_rate = rate
+
+    def keyboard_tracking(self) -> bool:
+        """
+        Get whether value_changed is emitted while typing.
+
+        Returns
+        -------
+        bool
+            Whether value_changed is emitted for each valid edit, rather
+            than when editing finishes.
+        """
+        return self._keyboard_tracking
+
+    def set_keyboard_tracking(self, tracking: bool):
+        """
+        Set whether value_changed is emitted while typing.
+
+        Parameters
+        ----------
+        tracking:
+            If True, value_changed is emitted for each edit that changes
+            the value to a valid one. If False, it's emitted once, when
+            Enter is pressed or the box loses focus.
+        """
+        self._keyboard_tracking = tracking
+
+    def decimals(self) -> int:
+        """
+        Get the number of digits after the decimal point.
+
+        Returns
+        -------
+        int
+            The number of digits after the point, 0 if the values are ints.
+        """
+        return self._decimals
+
+    def set_decimals(self, decimals: int):
+        """
+        Set the number of digits after the decimal point.
+
+        With no decimals the values are Python ints, otherwise they're
+        Decimals rounded to the number of decimals. The value, bounds and
+        steps are converted.
+
+        Parameters
+        ----------
+        decimals:
+            The number of digits after the point, 0 for ints.
+        """
+        if decimals < 0:
+            raise ValueError('The number of decimals can\'t be negative.')
+
+        self._decimals = decimals
+        if decimals:
+            quantum = Decimal(1).scaleb(-decimals)
+            self._unit = quantum
+            self._convert = lambda value: Decimal(
+                str(value) if isinstance(value, float) else value
+                ).quantize(quantum, context=_EXACT)
+            self._format = '{{:.{}f}}'.format(decimals).format
+        else:
+            self._unit = 1
+            self._convert = int
+            self._format = str
+        self._validator.set_decimals(decimals)
+
+        self._step_size = self._convert_step(self._step_size)
+        self._page_step = self._convert_step(self._page_step)
+        self.set_range(self._bottom, self._top)
+        self._value = self._clamp(self._convert(self._value))
+        self.setText(self._format(self._value))
+
+    def step(self) -> Number:
+        """
+        Get the change in the value for a click of a button.
+
+        Returns
+        -------
+        Number
+            The step.
+        """
+        return self._step_size
+
+    def set_step(self, step: Number):
+        """
+        Set the change in the value for a click of a button.
+
+        Holding a button down repeats the step, growing it tenfold every
+        20 repeats.
+
+        Parameters
+        ----------
+        step:
+            The new step.
+        """
+        self._step_size = self._convert_step(step)
+
+    def page_step(self) -> Number:
+        """
+        Get the change in the value for a wheel notch with Shift held.
+
+        Returns
+        -------
+        Number
+            The page step.
+        """
+        return self._page_step
+
+    def set_page_step(self, page_step: Number):
+        """
+        Set the change in the value for a wheel notch with Shift held.
+
+        Parameters
+        ----------
+        page_step:
+            The new page step.
+        """
+        self._page_step = self._convert_step(page_step)
+
+    def _convert_step(self, step: Number) -> Number:
+        """
+        Convert a step for the number of decimals.
+
+        Parameters
+        ----------
+        step:
+            The step.
+
+        Returns
+        -------
+        Number
+            The step, rounded to the number of decimals but no smaller than
+            the smallest change.
+        """
+        return max(self._convert(abs(step)), self._unit)
+
+    def wheelEvent(self, event: QtGui.QWheelEvent):
+        """Change the value with the scroll wheel.
+
+        Each notch changes the value by the step, or the page step if Shift
+        is held. As in ScrollLineEdit, smaller deltas are added up into
+        whole notches, and the value is changed at most once a frame.
+
+        Parameters
+        ----------
+        event:
+            The event object.
+        """
+        self._wheel_page = bool(event.modifiers() & QtCore.Qt.ShiftModifier)
+        if self._wheel_steps.add_event(event):
+            event.accept()
+        else:
+            super(PlusMinusBox, self).wheelEvent(event)
+
+    def _on_wheel_stepped(self, steps: int):
+        """
+        Change the value by the steps of the wheel.
+
+        Parameters
+        ----------
+        steps:
+            The summed steps since the last frame.
+        """
+        step = self._page_step if self._wheel_page else self._step_size
+        with decimal.localcontext(_EXACT):
+            delta = steps * step
+        if self._step(delta):
+            self.value_changed.emit(self._value)
+
     def _decrease(self):
         """Decrease the value of the box."""
-        valid = self._validator.validate(str(self.value - 1), 0)
-        if valid[0] == self._validator.Acceptable:
-            self._value -= 1
-            self.setText(str(self.value))
+        # The release that ends a hold doesn't step again.
+        if (not self._leftRepeat.is_repeating()
+                and self._step(-self._step_size)):
             self.value_changed.emit(self._value)
 
     def _increase(self):
         """Increase the value of the box."""
-        valid = self._validator.validate(str(self.value + 1), 0)
-        if valid[0] == self._validator.Acceptable:
-            self._value += 1
-            self.setText(str(self.value))
+        if (not self._rightRepeat.is_repeating()
+                and self._step(self._step_size)):
+            self.value_changed.emit(self._value)
+
+    def _step(self, delta: Number) -> bool:
+        """
+        Change the value by a step, stopping at the bottom or top.
+
+        Parameters
+        ----------
+        delta:
+            The change in the value.
+
+        Returns
+        -------
+        bool
+            Whether the value changed.
+        """
+        with decimal.localcontext(_EXACT):
+            value = self._clamp(self._value + delta)
+        if value == self._value:
+            return False
+        self._value = value
+        self.setText(self._format(value))
+        return True
+
+    def _clamp(self, value: Number) -> Number:
+        """
+        Clamp a value to the bottom and top of the box.
+
+        Parameters
+        ----------
+        value:
+            The value to clamp.
+
+        Returns
+        -------
+        Number
+            The value, moved within the bounds.
+        """
+        if self._bottom is not None and value < self._bottom:
+            return self._bottom
+        if self._top is not None and value > self._top:
+            return self._top
+        return value
+
+    def _repeat_step(self, steps: int):
+        """
+        Change the value for a repeat of a held button.
+
+        Parameters
+        ----------
+        steps:
+            The number of steps to change the value by.
+        """
+        with decimal.localcontext(_EXACT):
+            delta = steps * self._step_size
+        if not self._step(delta):
+            return
+
+        self._emit_pending = True
+        if not self._emit_timer.isActive():
+            self._on_emit_timeout()
+
+    def _on_emit_timeout(self):
+        """Emit value_changed if a step is waiting, then wait again."""
+        if self._emit_pending:
+            self._emit_pending = False
             self.value_changed.emit(self._value)
+            self._emit_timer.start(round(1000 / self._emission_rate))
 
-    def keyPressEvent(self, event: QtGui.QKeyEvent):
-        super(PlusMinusBox, self).keyPressEvent(event)
-        text = self.text()
-        self._value = int(text)
+    def _flush_emit(self):
+        """Emit the last value when a held button is released."""
+        self._emit_timer.stop()
+        if self._emit_pending:
+            self._emit_pending = False
+            self.value_changed.emit(self._value)
+
+    def focusOutEvent(self, event: QtGui.QFocusEvent):
+        """
+        Overwrite parent method to put back the text of the value if the
+        typed text isn't acceptable.
+        """
+        super(PlusMinusBox, self).focusOutEvent(event)
+        if not self.hasAcceptableInput():
+            self.setText(self._format(self._value))
+
+    def _on_text_edited(self, text: str):
+        """
+        Parse the typed text if keyboard tracking is on.
+
+        Parameters
+        ----------
+        text:
+            The text of the box.
+        """
+        if self._keyboard_tracking:
+            self._commit_text()
+
+    def _commit_text(self):
+        """Set the value from the typed text, if it's acceptable."""
+        if not self.hasAcceptableInput():
+            return
+        value = self._convert(self.text().strip())
+        if value != self._value:
+            self._value = value
+            self.value_changed.emit(value)
 
     @property
-    def value(self) -> int:
+    def value(self) -> Number:
         """Get the value of the box."""
         return self._value
 
     @value.setter
-    def value(self, new_value: int):
-        """Set the value of the box."""
-        if (self._validator.validate(str(new_value), 0)[0]
-                == self._validator.Acceptable):
-            self._value = new_value
-            self.setText(str(new_value))
+    def value(self, new_value: Number):
+        """Set the value of the box, if it's valid and within its bounds.
 
-    def set_range(self, bottom: Optional[int] = None,
-                  top: Optional[int] = None):
+        Values that aren't numbers, and values that aren't whole numbers
+        when there are no decimals, are ignored rather than truncated.
+        """
+        try:
+            value = self._convert(new_value)
+        except (ArithmeticError, TypeError, ValueError):
+            return
+        if not self._decimals and not isinstance(new_value, str) \
+                and value != new_value:
+            return
+        if self._clamp(value) == value:
+            self._value = value
+            self.setText(self._format(value))
+
+    def set_range(self, bottom: Optional[Number] = None,
+                  top: Optional[Number] = None):
         """
         Set the range of possible values for the box.
 
         Parameters
         ----------
         bottom:
-            The new bottom value for the box.
+            The new bottom value for the box, or None for no bottom.
         top:
-            The new top value for the box.
+            The new top value for the box, or None for no top.
         """
-        self.set_bottom(bottom)
-        self.set_top(top)
+        self._bottom = None if bottom is None else self._convert(bottom)
+        self._top = None if top is None else self._convert(top)
+        self._validator.set_range(self._bottom, self._top)
 
-    def set_bottom(self, bottom: Optional[int]):
+    def set_bottom(self, bottom: Optional[Number]):
         """
         Set the minimum bottom value.
 
         Parameters
         ----------
         bottom:
-            The new bottom value.
+            The new bottom value, or None for no bottom.
 
         """
-        if bottom is not None:
-            self._validator.setBottom(bottom)
-        else:
-            self._validator.setBottom(-2147483648)
+        self.set_range(bottom, self._top)
 
-    def set_top(self, top: Optional[int]):
+    def set_top(self, top: Optional[Number]):
         """
         Set the maximum top value.
 
         Parameters
         ----------
         top:
-            THe new top value.
+            The new top value, or None for no top.
         """
-        if top is not None:
-            self._validator.setTop(top)
-        else:
-            self._validator.setTop(2147483647)
+        self.set_range(self._bottom, top)
 
     def _set_layout(self):
         """
@@ -173,10 +623,14 @@ if __name__ == '__main__':
         app = QtWidgets.QApplication([])
 
     box = PlusMinusBox()
+    decimal_box = PlusMinusBox(minimum=-1, maximum=1, decimals=3,
+                               step=0.005, page_step=0.1)
+    decimal_box.value_changed.connect(print)
 
     layout = QtWidgets.QHBoxLayout()
     layout.addStretch()
     layout.addWidget(box)
+    layout.addWidget(decimal_box)
     layout.addStretch()
     widget = QtWidgets.QWidget()
     widget.setLayout(layout)
@@ -0,0 +1,206 @@
+"""
+An item delegate that edits int cells with a PlusMinusBox.
+
+@author: Eddie
+"""
+
+from typing import Optional
+
+from PyQt5 import QtWidgets, QtCore, QtGui
+
+try:
+    from .plus_minus_box import PlusMinusBox
+    from .pooled_editor_delegate import PooledEditorDelegate
+except ImportError:  # Run as a script, not from the package
+    from plus_minus_box import PlusMinusBox
+    from pooled_editor_delegate import PooledEditorDelegate
+
+
+class PlusMinusBoxDelegate(PooledEditorDelegate):
+    """Paint int cells as a PlusMinusBox and edit them with one.
+
+    Cells are painted as their value with the - and + buttons either side,
+    with no widget per cell. One PlusMinusBox per column is created on
+    demand and reused for every edit in the column.
+
+    The value is only committed if the editor's validator accepts its
+    text, the same as the text a PlusMinusBox accepts.
+    """
+
+    def __init__(self, parent: Optional[QtCore.QObject] = None,
+                 minimum: Optional[int] = 0, maximum: Optional[int] = None):
+        """Initialize the delegate.
+
+        Parameters
+        ----------
+        parent:
+            The parent QObject, usually the view.
+        minimum:
+            The minimum value of the editors, or None for no minimum.
+        maximum:
+            The maximum value of the editors, or None for no maximum.
+
+        """
+        super(PlusMinusBoxDelegate, self).__init__(parent)
+
+        self._minimum = minimum
+        self._maximum = maximum
+
+    def set_range(self, bottom: Optional[int] = None,
+                  top: Optional[int] = None):
+        """
+        Set the range of possible values for the editors.
+
+        Parameters
+        ----------
+        bottom:
+            The new bottom value for the editors.
+        top:
+            The new top value for the editors.
+        """
+        self._minimum = bottom
+        self._maximum = top
+        for editor in self._live_editors():
+            editor.set_range(bottom=bottom, top=top)
+
+    def paint(self, painter: QtGui.QPainter,
+              option: QtWidgets.QStyleOptionViewItem,
+              index: QtCore.QModelIndex):
+        """Paint the cell background, the value and the buttons.
+
+        Parameters
+        ----------
+        painter:
+            The painter of the view.
+        option:
+            The style of the cell.
+        index:
+            The index of the cell.
+
+        """
+        option = QtWidgets.QStyleOptionViewItem(option)
+        self.initStyleOption(option, index)
+
+        widget = option.widget
+        style = (widget.style() if widget is not None
+                 else QtWidgets.QApplication.style())
+        style.drawPrimitive(QtWidgets.QStyle.PE_PanelItemViewItem, option,
+                            painter, widget)
+
+        value = index.data(QtCore.Qt.EditRole)
+        if value is None:
+            return
+
+        # The buttons are squares as high as the cell, as in PlusMinusBox.
+        rect = option.rect
+        button_size = QtCore.QSize(rect.height(), rect.height())
+        left = QtCore.QRect(rect.topLeft(), button_size)
+        right = QtCore.QRect(rect.topRight(), button_size).translated(
+            1 - button_size.width(), 0
+            )
+        text = rect.adjusted(button_size.width(), 0,
+                             -button_size.width(), 0)
+
+        enabled = bool(option.state & QtWidgets.QStyle.State_Enabled)
+        text_role = (QtGui.QPalette.HighlightedText
+                     if option.state & QtWidgets.QStyle.State_Selected
+                     else QtGui.QPalette.Text)
+
+        painter.save()
+        painter.setFont(option.font)
+        style.drawItemText(painter, left, QtCore.Qt.AlignCenter,
+                           option.palette, enabled, '-', text_role)
+        style.drawItemText(painter, right, QtCore.Qt.AlignCenter,
+                           option.palette, enabled, '+', text_role)
+        style.drawItemText(painter, text, QtCore.Qt.AlignCenter,
+                           option.palette, enabled, str(value), text_role)
+        painter.restore()
+
+    def setEditorData(self, editor: PlusMinusBox,
+                      index: QtCore.QModelIndex):
+        """Set the value of the editor from the cell.
+
+        Values outside the range of the editor are clamped to it.
+
+        Parameters
+        ----------
+        editor:
+            The editor.
+        index:
+            The index of the cell.
+
+        """
+        value = index.data(QtCore.Qt.EditRole)
+        value = 0 if value is None else int(value)
+        if self._minimum is not None:
+            value = max(value, self._minimum)
+        if self._maximum is not None:
+            value = min(value, self._maximum)
+        editor.value = value
+
+    def setModelData(self, editor: PlusMinusBox,
+                     model: QtCore.QAbstractItemModel,
+                     index: QtCore.QModelIndex):
+        """Set the cell from the editor, if its text is acceptable.
+
+        Parameters
+        ----------
+        editor:
+            The editor.
+        model:
+            The model of the cell.
+        index:
+            The index of the cell.
+
+        """
+        if editor.hasAcceptableInput():
+            model.setData(index, editor.value, QtCore.Qt.EditRole)
+
+    def _create_editor(self, parent: QtWidgets.QWidget,
+                       option: QtWidgets.QStyleOptionViewItem,
+                       index: QtCore.QModelIndex) -> PlusMinusBox:
+        """Create the editor of a column.
+
+        Parameters
+        ----------
+        parent:
+            The parent of the editor, the viewport of the view.
+        option:
+            The style of the cell.
+        index:
+            The index of the cell being edited.
+
+        Returns
+        -------
+        PlusMinusBox
+            The new editor.
+
+        """
+        editor = PlusMinusBox(parent, minimum=self._minimum,
+                              maximum=self._maximum)
+        editor.setFrame(False)
+        return editor
+
+
+if __name__ == '__main__':
+    app = QtWidgets.QApplication.instance()
+    if app is None:
+        app = QtWidgets.QApplication([])
+
+    model = QtGui.QStandardItemModel(100000, 2)
+    for row in range(model.rowCount()):
+        model.setData(model.index(row, 0), 'Row {}'.format(row))
+        model.setData(model.index(row, 1), row % 100)
+
+    view = QtWidgets.QTableView()
+    view.setModel(model)
+    view.setItemDelegateForColumn(
+        1, PlusMinusBoxDelegate(view, minimum=0, maximum=1000)
+        )
+    view.setColumnWidth(1, 150)
+    model.dataChanged.connect(
+        lambda index, *_: print(index.row(), index.data())
+        )
+    view.show()
+
+    app.exec()
@@ -0,0 +1,153 @@
+"""
+An item delegate that reuses one editor per column.
+
+@author: Eddie
+"""
+
+from typing import Dict, List, Optional, Set
+
+from PyQt5 import QtWidgets, QtCore, sip
+
+
+class PooledEditorDelegate(QtWidgets.QStyledItemDelegate):
+    """An item delegate that creates one editor per column and reuses it.
+
+    The editor of a column is created the first time a cell of the column
+    is edited. When editing ends it's hidden rather than deleted, and it's
+    handed out again for the next edit in the column, so a big table
+    costs no more than one editor per column. While the editor of a column
+    is in use, such as by a persistent editor, other cells of the column
+    get editors of their own, which are deleted when editing ends.
+
+    The class is abstract: subclasses create the editor in _create_editor.
+    """
+
+    def __init__(self, parent: Optional[QtCore.QObject] = None):
+        """Initialize the delegate, with no editors.
+
+        Parameters
+        ----------
+        parent:
+            The parent QObject, usually the view.
+
+        """
+        super(PooledEditorDelegate, self).__init__(parent)
+
+        # The editor of each column, by column number, the columns whose
+        # editor is in use, and the editors created while it was
+        self._editors: Dict[int, QtWidgets.QWidget] = {}
+        self._checked_out: Set[int] = set()
+        self._extra_editors: List[QtWidgets.QWidget] = []
+
+    def createEditor(self, parent: QtWidgets.QWidget,
+                     option: QtWidgets.QStyleOptionViewItem,
+                     index: QtCore.QModelIndex) -> QtWidgets.QWidget:
+        """Get the editor of the column, creating it for the first edit.
+
+        If the editor of the column is already in use, a new editor is
+        created for the cell instead.
+
+        Parameters
+        ----------
+        parent:
+            The parent of the editor, the viewport of the view.
+        option:
+            The style of the cell.
+        index:
+            The index of the cell.
+
+        Returns
+        -------
+        QtWidgets.QWidget
+            The editor.
+
+        """
+        column = index.column()
+        editor = self._editors.get(column)
+        if editor is None or sip.isdeleted(editor):
+            editor = self._create_editor(parent, option, index)
+            self._editors[column] = editor
+        elif column in self._checked_out:
+            editor = self._create_editor(parent, option, index)
+            self._extra_editors = self._live_extra_editors() + [editor]
+            return editor
+        elif editor.parent() is not parent:
+            editor.setParent(parent)
+        self._checked_out.add(column)
+        return editor
+
+    def destroyEditor(self, editor: QtWidgets.QWidget,
+                      index: QtCore.QModelIndex):
+        """Hide a pooled editor rather than deleting it.
+
+        Editors created while the pooled editor was in use are deleted.
+
+        Parameters
+        ----------
+        editor:
+            The editor.
+        index:
+            The index of the cell it edited.
+
+        """
+        for column, pooled in self._editors.items():
+            if editor is pooled:
+                editor.hide()
+                self._checked_out.discard(column)
+                return
+
+        self._extra_editors = [extra for extra in self._live_extra_editors()
+                               if extra is not editor]
+        super(PooledEditorDelegate, self).destroyEditor(editor, index)
+
+    def updateEditorGeometry(self, editor: QtWidgets.QWidget,
+                             option: QtWidgets.QStyleOptionViewItem,
+                             index: QtCore.QModelIndex):
+        """Fit the editor to the cell.
+
+        Parameters
+        ----------
+        editor:
+            The editor.
+        option:
+            The style of the cell.
+        index:
+            The index of the cell.
+
+        """
+        editor.setGeometry(option.rect)
+
+    def _create_editor(self, parent: QtWidgets.QWidget,
+                       option: QtWidgets.QStyleOptionViewItem,
+                       index: QtCore.QModelIndex) -> QtWidgets.QWidget:
+        """Create the editor of a column.
+
+        Parameters
+        ----------
+        parent:
+            The parent of the editor, the viewport of the view.
+        option:
+            The style of the cell.
+        index:
+            The index of the cell being edited.
+
+        Returns
+        -------
+        QtWidgets.QWidget
+            The new editor.
+
+        """
+        raise NotImplementedError(
+            '{} must implement _create_editor to create the editor of a '
+            'column.'.format(type(self).__name__)
+            )
+
+    def _live_editors(self) -> List[QtWidgets.QWidget]:
+        """Get the editors that have been created and not deleted."""
+        return [editor for editor in self._editors.values()
+                if not sip.isdeleted(editor)] + self._live_extra_editors()
+
+    def _live_extra_editors(self) -> List[QtWidgets.QWidget]:
+        """Get the editors created outside the pool and not deleted."""
+        return [editor for editor in self._extra_editors
+                if not sip.isdeleted(editor)]
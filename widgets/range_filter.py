@@ -0,0 +1,203 @@
+"""
+A filter over a data array driven by a range slider.
+
+@author: Eddie
+"""
+
+from typing import Optional, Tuple
+
+from PyQt5 import QtWidgets, QtCore
+
+try:
+    from .multi_slider import Number
+    from .range_slider import RangeSlider
+except ImportError:  # Run as a script, not from the package
+    from multi_slider import Number
+    from range_slider import RangeSlider
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+
+class RangeFilter(QtCore.QObject):
+    """A selection of the values of an array between a slider's low and high.
+
+    The array is sorted once, so each (low, high) is found with a binary
+    search of the sorted values instead of a comparison over the whole
+    array. The selection mask is updated incrementally, only for the rows
+    between the old and new bounds.
+
+    Needs NumPy.
+    """
+
+    #: Signal emitted when the selection changes, with the indices of the
+    #: rows added to the selection and the rows removed from it.
+    selection_changed = QtCore.pyqtSignal(object, object)
+
+    def __init__(self, slider: RangeSlider, data,
+                 parent: Optional[QtCore.QObject] = None):
+        """Initialize the filter.
+
+        Sorts the data and selects the values between the slider's low and
+        high.
+
+        Parameters
+        ----------
+        slider:
+            The slider whose sliderMoved signal sets the selected range.
+        data:
+            A one dimensional array like of the values to filter.
+        parent:
+            The parent QObject. If not given, the slider is the parent.
+
+        """
+        if np is None:
+            raise ImportError('NumPy is needed to filter data.')
+
+        super(RangeFilter, self).__init__(
+            slider if parent is None else parent
+            )
+
+        self._data = np.asarray(data)
+        if self._data.ndim != 1:
+            raise ValueError('The data must be one dimensional.')
+
+        # NaNs are sorted to the end, so they're never selected.
+        self._order = np.argsort(self._data, kind='stable')
+        self._sorted = self._data[self._order]
+
+        self._mask = np.zeros(len(self._data), dtype=bool)
+        self._start = 0
+        self._stop = 0
+        self._low: Optional[Number] = None
+        self._high: Optional[Number] = None
+
+        self._slider = slider
+        self._slider.sliderMoved.connect(self.set_range)
+        self.set_range(slider.low(), slider.high())
+
+    def slider(self) -> RangeSlider:
+        """Get the slider driving the filter.
+
+        Returns
+        -------
+        RangeSlider
+            The slider driving the filter.
+
+        """
+        return self._slider
+
+    def data(self):
+        """Get the data being filtered.
+
+        Returns
+        -------
+        numpy.ndarray
+            The values being filtered.
+
+        """
+        return self._data
+
+    def bounds(self) -> Tuple[Number, Number]:
+        """Get the bounds of the selection.
+
+        Returns
+        -------
+        Tuple[Number, Number]
+            The low and high values of the selection, inclusive.
+
+        """
+        return self._low, self._high
+
+    def mask(self):
+        """Get the selection mask.
+
+        The mask is updated in place, so copy it to keep a snapshot.
+
+        Returns
+        -------
+        numpy.ndarray
+            A boolean array, True for the rows in the selection.
+
+        """
+        return self._mask
+
+    def indices(self):
+        """Get the indices of the selected rows.
+
+        Returns
+        -------
+        numpy.ndarray
+            The indices of the selected rows, in order of their values.
+
+        """
+        return self._order[self._start:self._stop]
+
+    def count(self) -> int:
+        """Get the number of selected rows.
+
+        Returns
+        -------
+        int
+            The number of rows in the selection.
+
+        """
+        return self._stop - self._start
+
+    def set_range(self, low: Number, high: Number):
+        """Select the values between low and high.
+
+        Parameters
+        ----------
+        low:
+            The lowest value selected.
+        high:
+            The highest value selected.
+
+        """
+        self._low = low
+        self._high = high
+
+        start = int(np.searchsorted(self._sorted, low, side='left'))
+        stop = int(np.searchsorted(self._sorted, high, side='right'))
+        stop = max(start, stop)
+
+        # Only the rows between the old and new bounds change
+        old_start, old_stop = self._start, self._stop
+        added = np.concatenate((
+            self._order[start:min(stop, old_start)],
+            self._order[max(start, old_stop):stop],
+            ))
+        removed = np.concatenate((
+            self._order[old_start:min(old_stop, start)],
+            self._order[max(old_start, stop):old_stop],
+            ))
+
+        self._start, self._stop = start, stop
+        self._mask[added] = True
+        self._mask[removed] = False
+
+        if len(added) or len(removed):
+            self.selection_changed.emit(added, removed)
+
+
+if __name__ == "__main__":
+    app = QtWidgets.QApplication.instance()
+    if app is None:
+        app = QtWidgets.QApplication([])
+
+    slider = RangeSlider(QtCore.Qt.Horizontal)
+    slider.setRange(0, 86400)
+    slider.set_low(0)
+    slider.set_high(86400)
+
+    range_filter = RangeFilter(
+        slider, np.random.randint(0, 86400, size=5000000)
+        )
+    range_filter.selection_changed.connect(
+        lambda added, removed: print(range_filter.count())
+        )
+    slider.show()
+    app.exec()
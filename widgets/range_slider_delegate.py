@@ -0,0 +1,279 @@
+"""
+An item delegate that shows and edits (low, high) cells as range sliders.
+
+@author: Eddie
+"""
+
+from typing import Optional, Type
+
+from PyQt5 import QtWidgets, QtCore, QtGui
+
+try:
+    from .multi_slider import MultiSlider, Number
+    from .pooled_editor_delegate import PooledEditorDelegate
+    from .range_slider import RangeSlider
+except ImportError:  # Run as a script, not from the package
+    from multi_slider import MultiSlider, Number
+    from pooled_editor_delegate import PooledEditorDelegate
+    from range_slider import RangeSlider
+
+#: The QSlider range the handles are painted with, fine enough for any
+#: width of cell.
+_PAINT_STEPS = 1 << 16
+
+
+class RangeSliderDelegate(PooledEditorDelegate):
+    """Paint and edit (low, high) cells of an item view as range sliders.
+
+    The groove and the two handles are painted with the style straight
+    from the model data, with no widget per cell. A real RangeSlider is
+    created as the editor of the first cell edited in a column, and the
+    same one is reused for every later edit, so memory doesn't grow with
+    the number of rows.
+
+    The EditRole of the cells holds a (low, high) tuple. The editor
+    commits it when a handle is released.
+    """
+
+    def __init__(self, parent: Optional[QtCore.QObject] = None,
+                 minimum: Number = 0, maximum: Number = 99,
+                 resolution: Number = 1,
+                 editor_class: Type[RangeSlider] = RangeSlider):
+        """Initialize the delegate.
+
+        Parameters
+        ----------
+        parent:
+            The parent QObject, usually the view.
+        minimum:
+            The minimum value of the sliders.
+        maximum:
+            The maximum value of the sliders.
+        resolution:
+            The resolution of the values of the sliders.
+        editor_class:
+            The class of the editor, RangeSlider or a subclass of it.
+
+        """
+        super(RangeSliderDelegate, self).__init__(parent)
+
+        self._minimum = minimum
+        self._maximum = maximum
+        self._resolution = resolution
+        self._editor_class = editor_class
+
+    def minimum(self) -> Number:
+        """Get the minimum value of the sliders.
+
+        Returns
+        -------
+        Number
+            The minimum value of the sliders.
+
+        """
+        return self._minimum
+
+    def maximum(self) -> Number:
+        """Get the maximum value of the sliders.
+
+        Returns
+        -------
+        Number
+            The maximum value of the sliders.
+
+        """
+        return self._maximum
+
+    def set_range(self, minimum: Number, maximum: Number):
+        """Set the minimum and maximum values of the sliders.
+
+        Parameters
+        ----------
+        minimum:
+            The new minimum value of the sliders.
+        maximum:
+            The new maximum value of the sliders.
+
+        """
+        self._minimum = minimum
+        self._maximum = maximum
+        for editor in self._live_editors():
+            editor.setRange(minimum, maximum)
+
+    def resolution(self) -> Number:
+        """Get the resolution of the values of the sliders.
+
+        Returns
+        -------
+        Number
+            The resolution of the values.
+
+        """
+        return self._resolution
+
+    def set_resolution(self, resolution: Number):
+        """Set the resolution of the values of the sliders.
+
+        Parameters
+        ----------
+        resolution:
+            The new resolution of the values.
+
+        """
+        self._resolution = resolution
+        for editor in self._live_editors():
+            editor.set_resolution(resolution)
+
+    def paint(self, painter: QtGui.QPainter,
+              option: QtWidgets.QStyleOptionViewItem,
+              index: QtCore.QModelIndex):
+        """Paint the cell background, the groove and the handles.
+
+        Parameters
+        ----------
+        painter:
+            The painter of the view.
+        option:
+            The style of the cell.
+        index:
+            The index of the cell.
+
+        """
+        option = QtWidgets.QStyleOptionViewItem(option)
+        self.initStyleOption(option, index)
+
+        widget = option.widget
+        style = (widget.style() if widget is not None
+                 else QtWidgets.QApplication.style())
+        style.drawPrimitive(QtWidgets.QStyle.PE_PanelItemViewItem, option,
+                            painter, widget)
+
+        values = index.data(QtCore.Qt.EditRole)
+        if values is None:
+            return
+
+        slider_option = QtWidgets.QStyleOptionSlider()
+        slider_option.rect = option.rect
+        slider_option.palette = option.palette
+        slider_option.direction = option.direction
+        slider_option.fontMetrics = option.fontMetrics
+        slider_option.state = (option.state & QtWidgets.QStyle.State_Enabled
+                               | QtWidgets.QStyle.State_Horizontal)
+        slider_option.orientation = QtCore.Qt.Horizontal
+        slider_option.minimum = 0
+        slider_option.maximum = _PAINT_STEPS
+        slider_option.upsideDown = option.direction == QtCore.Qt.RightToLeft
+
+        slider_option.subControls = QtWidgets.QStyle.SC_SliderGroove
+        style.drawComplexControl(QtWidgets.QStyle.CC_Slider, slider_option,
+                                 painter, widget)
+
+        slider_option.subControls = QtWidgets.QStyle.SC_SliderHandle
+        for value in values:
+            position = self._paint_position(value)
+            slider_option.sliderPosition = position
+            slider_option.sliderValue = position
+            style.drawComplexControl(QtWidgets.QStyle.CC_Slider,
+                                     slider_option, painter, widget)
+
+    def _create_editor(self, parent: QtWidgets.QWidget,
+                       option: QtWidgets.QStyleOptionViewItem,
+                       index: QtCore.QModelIndex) -> RangeSlider:
+        """Create the editor of a column.
+
+        Parameters
+        ----------
+        parent:
+            The parent of the editor, the viewport of the view.
+        option:
+            The style of the cell.
+        index:
+            The index of the cell being edited.
+
+        Returns
+        -------
+        RangeSlider
+            The new editor, which commits when a handle is released.
+
+        """
+        editor = self._editor_class(QtCore.Qt.Horizontal, parent)
+        editor.setRange(self._minimum, self._maximum)
+        editor.set_resolution(self._resolution)
+        editor.setAutoFillBackground(True)
+        editor.set_emission_policy(MultiSlider.EmitOnRelease)
+        editor.sliderMoved.connect(lambda *_: self.commitData.emit(editor))
+        return editor
+
+    def setEditorData(self, editor: RangeSlider, index: QtCore.QModelIndex):
+        """Set the handles of the editor from the cell.
+
+        Parameters
+        ----------
+        editor:
+            The editor.
+        index:
+            The index of the cell.
+
+        """
+        values = index.data(QtCore.Qt.EditRole)
+        if values is not None:
+            # Setting a handle past the other one pushes it, so set the low
+            # again in case setting the high pushed it.
+            low, high = values
+            editor.set_low(low)
+            editor.set_high(high)
+            editor.set_low(low)
+
+    def setModelData(self, editor: RangeSlider,
+                     model: QtCore.QAbstractItemModel,
+                     index: QtCore.QModelIndex):
+        """Set the cell from the handles of the editor.
+
+        Parameters
+        ----------
+        editor:
+            The editor.
+        model:
+            The model of the cell.
+        index:
+            The index of the cell.
+
+        """
+        model.setData(index, (editor.low(), editor.high()),
+                      QtCore.Qt.EditRole)
+
+    def _paint_position(self, value: Number) -> int:
+        """Get the QSlider position to paint a value at."""
+        span = self._maximum - self._minimum
+        if not span:
+            return 0
+        fraction = (value - self._minimum) / span
+        return min(max(round(fraction * _PAINT_STEPS), 0), _PAINT_STEPS)
+
+
+if __name__ == '__main__':
+    import random
+
+    app = QtWidgets.QApplication.instance()
+    if app is None:
+        app = QtWidgets.QApplication([])
+
+    model = QtGui.QStandardItemModel(100000, 2)
+    for row in range(model.rowCount()):
+        low = random.randint(0, 86400)
+        model.setData(model.index(row, 0), 'Row {}'.format(row))
+        model.setData(model.index(row, 1),
+                      (low, random.randint(low, 86400)))
+
+    view = QtWidgets.QTableView()
+    view.setModel(model)
+    view.setItemDelegateForColumn(
+        1, RangeSliderDelegate(view, minimum=0, maximum=86400)
+        )
+    view.setColumnWidth(1, 300)
+    model.dataChanged.connect(
+        lambda index, *_: print(index.row(), index.data())
+        )
+    view.show()
+
+    app.exec()
@@ -6,15 +6,26 @@ Created on Thu Mar 26 16:18:54 2020.
 
 from PyQt5 import QtWidgets, QtCore, QtGui
 
+try:
+    from .wheel_steps import WheelSteps
+except ImportError:  # Run as a script, not from the package
+    from wheel_steps import WheelSteps
+
 
 class ScrollLineEdit(QtWidgets.QLineEdit):
     """A line edit with scrolling capabilities.
 
     This class is similar to a regular line edit box, except scrolling
     with a mouse wheel increases or decreases the value of the number.
+
+    Wheel deltas are added up into whole steps of a notch each, so
+    touchpads and smooth-scrolling mice, which send many small deltas per
+    notch, step as far as a notched wheel. The steps are emitted at most
+    once a frame, summed.
     """
 
-    #: Signal emitted when the mouse wheel is scrolled.
+    #: Signal emitted with the summed steps when the mouse wheel is
+    #: scrolled, each step 10 if shift is pressed.
     wheel_scrolled = QtCore.pyqtSignal(int)
 
     def __init__(self, parent: QtWidgets.QWidget, *args, **kwargs):
@@ -28,6 +39,35 @@ class ScrollLineEdit(QtWidgets.QLineEdit):
         self._is_key_pressed = False
         self._parent.shift_pressed.connect(self._set_scroll_amount)
 
+        # Wheel deltas are added up into steps, emitted once a frame
+        self._wheel_steps = WheelSteps(self)
+        self._wheel_steps.stepped.connect(self._on_wheel_stepped)
+
+    def acceleration(self) -> bool:
+        """Get whether fast spins of the wheel take bigger steps.
+
+        Returns
+        -------
+        bool
+            Whether the steps are accelerated.
+
+        """
+        return self._wheel_steps.acceleration()
+
+    def set_acceleration(self, acceleration: bool):
+        """Set whether fast spins of the wheel take bigger steps.
+
+        With acceleration, the steps are multiplied by one more for every
+        20 steps per second the wheel is spun.
+
+        Parameters
+        ----------
+        acceleration:
+            Whether the steps are accelerated.
+
+        """
+        self._wheel_steps.set_acceleration(acceleration)
+
     def focusInEvent(self, event: QtGui.QFocusEvent):
         """Select the text in the edit box when it is clicked.
 
@@ -49,12 +89,20 @@ class ScrollLineEdit(QtWidgets.QLineEdit):
         event:
             The event object.
         """
-        delta = 1 if event.angleDelta().y() > 0 else -1
-        delta = delta * 10**int(self._is_key_pressed)
-
-        self.wheel_scrolled.emit(delta)
+        self._wheel_steps.add_event(event)
         event.accept()
 
+    def _on_wheel_stepped(self, steps: int):
+        """
+        Emit the steps of the wheel, each 10 if shift is pressed.
+
+        Parameters
+        ----------
+        steps:
+            The summed steps since the last frame.
+        """
+        self.wheel_scrolled.emit(steps * 10**int(self._is_key_pressed))
+
     def _set_scroll_amount(self, pressed: bool):
         """
         Set the scroll amount to a small step or a large step based on if
@@ -0,0 +1,429 @@
+"""
+A range slider over datetime64 values, which zooms in on part of the range.
+
+@author: Eddie
+"""
+
+from typing import Optional, Tuple
+
+from PyQt5 import QtWidgets, QtCore, QtGui
+
+try:
+    from .multi_slider import Number, _decimal_tick_intervals
+    from .range_slider import RangeSlider
+except ImportError:  # Run as a script, not from the package
+    from multi_slider import Number, _decimal_tick_intervals
+    from range_slider import RangeSlider
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+_NS = 1
+_US = 1000 * _NS
+_MS = 1000 * _US
+_S = 1000 * _MS
+_MIN = 60 * _S
+_H = 60 * _MIN
+_D = 24 * _H
+
+#: The minor and major tick intervals for times, in nanoseconds.
+_TIME_TICK_INTERVALS = tuple(
+    (minor * unit, major * unit)
+    for unit in (_NS, _US, _MS)
+    for minor, major in ((1, 5), (2, 10), (5, 10), (10, 50), (20, 100),
+                         (50, 100), (100, 500), (200, 1000), (500, 1000))
+    ) + (
+    (_S, 5 * _S), (2 * _S, 10 * _S), (5 * _S, 30 * _S), (10 * _S, _MIN),
+    (15 * _S, _MIN), (30 * _S, 5 * _MIN), (_MIN, 5 * _MIN),
+    (2 * _MIN, 10 * _MIN), (5 * _MIN, 30 * _MIN), (10 * _MIN, _H),
+    (15 * _MIN, _H), (30 * _MIN, 3 * _H), (_H, 6 * _H), (2 * _H, 12 * _H),
+    (3 * _H, _D), (6 * _H, _D), (12 * _H, _D), (_D, 7 * _D),
+    (2 * _D, 14 * _D), (7 * _D, 28 * _D),
+    )
+
+
+class TimeRangeSlider(RangeSlider):
+    """A range slider over datetime64 values.
+
+    The range, low and high are datetime64 values, kept internally as int
+    nanoseconds since the epoch, so there is no loss of precision. The
+    values of the handles and the resolution are in nanoseconds.
+
+    Scrolling the mouse wheel, or pinching, zooms into part of the range
+    around the pointer, so a long range can be picked to the resolution
+    even when each pixel covers many seconds. Scrolling sideways pans the
+    zoomed part. The low and high are kept while zooming, even if they're
+    outside the visible part. The value to pixel mapping and the tick
+    marks are only computed for the visible part, with tick marks at whole
+    seconds, minutes, hours or days.
+
+    Needs NumPy.
+    """
+
+    #: Signal emitted when the slider is moved, with datetime64 values.
+    sliderMoved = QtCore.pyqtSignal(object, object)
+
+    def __init__(self, *args, **kwargs):
+        """Initialize the slider.
+
+        Initializes the range slider over one day from the epoch, with
+        decimated tick marks.
+
+        """
+        if np is None:
+            raise ImportError('NumPy is needed for datetime64 values.')
+
+        super(TimeRangeSlider, self).__init__(*args, **kwargs)
+
+        self._zoom_factor = 0.8
+        self._minimum_visible_steps = 10
+
+        super(TimeRangeSlider, self).setRange(0, _D)
+        self.set_values([0, _D])
+        self.set_tick_decimation(True)
+        self.set_minimum_tick_spacing(6)
+
+        self.grabGesture(QtCore.Qt.PinchGesture)
+
+    def low(self) -> 'np.datetime64':
+        """Get the value of the low slider.
+
+        Returns
+        -------
+        numpy.datetime64
+            The value of the low slider.
+
+        """
+        return _to_time(super(TimeRangeSlider, self).low())
+
+    def set_low(self, low: 'np.datetime64'):
+        """Set the value of the low slider.
+
+        Parameters
+        ----------
+        low:
+            The value the low slider will be set to.
+
+        """
+        super(TimeRangeSlider, self).set_low(_from_time(low))
+
+    def high(self) -> 'np.datetime64':
+        """Get the value of the high slider.
+
+        Returns
+        -------
+        numpy.datetime64
+            The value of the high slider.
+
+        """
+        return _to_time(super(TimeRangeSlider, self).high())
+
+    def set_high(self, high: 'np.datetime64'):
+        """Set the value of the high slider.
+
+        Parameters
+        ----------
+        high:
+            The value the high slider will be set to.
+
+        """
+        super(TimeRangeSlider, self).set_high(_from_time(high))
+
+    def minimum(self) -> 'np.datetime64':
+        """Get the minimum value of the slider.
+
+        Returns
+        -------
+        numpy.datetime64
+            The minimum value of the slider.
+
+        """
+        return _to_time(self._minimum)
+
+    def setMinimum(self, minimum: 'np.datetime64'):
+        """Set the minimum value of the slider.
+
+        Parameters
+        ----------
+        minimum:
+            The new minimum value of the slider.
+
+        """
+        minimum = _from_time(minimum)
+        super(TimeRangeSlider, self).setRange(
+            minimum, max(minimum, self._maximum)
+            )
+
+    def maximum(self) -> 'np.datetime64':
+        """Get the maximum value of the slider.
+
+        Returns
+        -------
+        numpy.datetime64
+            The maximum value of the slider.
+
+        """
+        return _to_time(self._maximum)
+
+    def setMaximum(self, maximum: 'np.datetime64'):
+        """Set the maximum value of the slider.
+
+        Parameters
+        ----------
+        maximum:
+            The new maximum value of the slider.
+
+        """
+        maximum = _from_time(maximum)
+        super(TimeRangeSlider, self).setRange(
+            min(self._minimum, maximum), maximum
+            )
+
+    def setRange(self, minimum: 'np.datetime64', maximum: 'np.datetime64'):
+        """Set the minimum and maximum values of the slider.
+
+        The zoom is reset.
+
+        Parameters
+        ----------
+        minimum:
+            The new minimum value of the slider.
+        maximum:
+            The new maximum value of the slider.
+
+        """
+        self._visible_range = None
+        super(TimeRangeSlider, self).setRange(
+            _from_time(minimum), _from_time(maximum)
+            )
+
+    def set_resolution(self, resolution):
+        """Set the resolution of the slider values.
+
+        Parameters
+        ----------
+        resolution:
+            The smallest difference between two values of the slider, as a
+            timedelta64 or int nanoseconds.
+
+        """
+        if isinstance(resolution, np.timedelta64):
+            resolution = int(resolution.astype('timedelta64[ns]')
+                             .astype(np.int64))
+        super(TimeRangeSlider, self).set_resolution(int(resolution))
+
+    def visible_time_range(self) -> Tuple['np.datetime64', 'np.datetime64']:
+        """Get the zoomed part of the range of the slider.
+
+        Returns
+        -------
+        Tuple[numpy.datetime64, numpy.datetime64]
+            The minimum and maximum visible values.
+
+        """
+        minimum, maximum = self.visible_range()
+        return _to_time(minimum), _to_time(maximum)
+
+    def set_visible_time_range(self, minimum: Optional['np.datetime64'] = None,
+                               maximum: Optional['np.datetime64'] = None):
+        """Zoom into part of the range of the slider.
+
+        Parameters
+        ----------
+        minimum:
+            The minimum visible value. If None, the minimum of the slider.
+        maximum:
+            The maximum visible value. If None, the maximum of the slider.
+
+        """
+        self.set_visible_range(
+            None if minimum is None else _from_time(minimum),
+            None if maximum is None else _from_time(maximum),
+            )
+
+    def reset_zoom(self):
+        """Show the whole range of the slider."""
+        self.set_visible_range()
+
+    def zoom_factor(self) -> float:
+        """Get how much one wheel step zooms in.
+
+        Returns
+        -------
+        float
+            The fraction of the visible range kept per wheel step in.
+
+        """
+        return self._zoom_factor
+
+    def set_zoom_factor(self, factor: float):
+        """Set how much one wheel step zooms in.
+
+        Parameters
+        ----------
+        factor:
+            The fraction of the visible range kept per wheel step in,
+            between 0 and 1.
+
+        """
+        if not 0 < factor < 1:
+            raise ValueError('The zoom factor must be between 0 and 1.')
+        self._zoom_factor = factor
+
+    def wheelEvent(self, event: QtGui.QWheelEvent):
+        """Zoom around the pointer, or pan when scrolling sideways.
+
+        Parameters
+        ----------
+        event:
+            The event object.
+
+        """
+        delta = event.angleDelta()
+        if self.orientation() == QtCore.Qt.Vertical:
+            zoom, pan = delta.y(), delta.x()
+        elif abs(delta.x()) > abs(delta.y()):
+            zoom, pan = 0, delta.x()
+        else:
+            zoom, pan = delta.y(), 0
+
+        if zoom:
+            self._zoom(self._zoom_factor ** (zoom / 120), event.pos())
+        if pan:
+            self._pan(-pan / 120 / 10)
+        event.accept()
+
+    def event(self, event: QtCore.QEvent) -> bool:
+        """Zoom on pinch gestures.
+
+        Parameters
+        ----------
+        event:
+            The event object.
+
+        Returns
+        -------
+        bool
+            Whether the event was handled.
+
+        """
+        if event.type() == QtCore.QEvent.NativeGesture:
+            if event.gestureType() == QtCore.Qt.ZoomNativeGesture:
+                self._zoom(1 / (1 + event.value()), event.pos())
+                return True
+        elif event.type() == QtCore.QEvent.Gesture:
+            pinch = event.gesture(QtCore.Qt.PinchGesture)
+            if pinch is not None:
+                factor = pinch.scaleFactor()
+                if factor > 0:
+                    self._zoom(1 / factor, self.mapFromGlobal(
+                        pinch.centerPoint().toPoint()
+                        ))
+                event.accept(pinch)
+                return True
+        return super(TimeRangeSlider, self).event(event)
+
+    def _zoom(self, factor: float, anchor: QtCore.QPoint):
+        """Scale the visible range around a point.
+
+        Parameters
+        ----------
+        factor:
+            The scale of the new visible range over the old one.
+        anchor:
+            The point whose value stays in place.
+
+        """
+        minimum, maximum = self.visible_range()
+        value = self._pixel_pos_to_range_value(
+            self._pick(anchor) - self._slider_geometry().slider_length // 2
+            )
+
+        width = max(round((maximum - minimum) * factor),
+                    self._minimum_visible_steps * self._resolution)
+        if width >= self._maximum - self._minimum:
+            self.reset_zoom()
+            return
+
+        # Keep the fraction of the range before the anchor the same
+        start = value - round((value - minimum) * width
+                              / max(maximum - minimum, 1))
+        start = min(max(start, self._minimum), self._maximum - width)
+        self.set_visible_range(start, start + width)
+
+    def _pan(self, fraction: float):
+        """Move the visible range by a fraction of its width.
+
+        Parameters
+        ----------
+        fraction:
+            The fraction of the visible range to move by.
+
+        """
+        if self._visible_range is None:
+            return
+
+        minimum, maximum = self.visible_range()
+        width = maximum - minimum
+        start = minimum + round(width * fraction)
+        start = min(max(start, self._minimum), self._maximum - width)
+        self.set_visible_range(start, start + width)
+
+    def _tick_intervals(self, smallest: Number):
+        """Get the minor and major intervals of the tick marks.
+
+        The intervals are whole seconds, minutes, hours or days, or decimal
+        fractions of a second.
+
+        Parameters
+        ----------
+        smallest:
+            The smallest interval that keeps the tick marks at least the
+            minimum tick spacing apart (nanoseconds).
+
+        Returns
+        -------
+        Tuple[Number, Optional[Number]]
+            The minor and major tick intervals (nanoseconds).
+
+        """
+        if self._tick_interval >= smallest:
+            return self._tick_interval, None
+
+        for minor, major in _TIME_TICK_INTERVALS:
+            if minor >= smallest:
+                return minor, major
+
+        # Whole numbers of days past a month
+        minor, major = _decimal_tick_intervals(smallest / _D)
+        return max(round(minor), 1) * _D, max(round(major), 1) * _D
+
+
+def _to_time(value: int) -> 'np.datetime64':
+    """Convert int nanoseconds since the epoch to a datetime64."""
+    return np.datetime64(int(value), 'ns')
+
+
+def _from_time(value) -> int:
+    """Convert a datetime64, or anything numpy can parse as one, to int
+    nanoseconds since the epoch."""
+    return int(np.datetime64(value, 'ns').astype(np.int64))
+
+
+if __name__ == "__main__":
+    app = QtWidgets.QApplication.instance()
+    if app is None:
+        app = QtWidgets.QApplication([])
+
+    slider = TimeRangeSlider(QtCore.Qt.Horizontal)
+
+    slider.setRange(np.datetime64('2020-03-26'), np.datetime64('2020-03-27'))
+    slider.set_resolution(np.timedelta64(1, 's'))
+    slider.set_low(np.datetime64('2020-03-26T08:00'))
+    slider.set_high(np.datetime64('2020-03-26T17:00'))
+    slider.setTickPosition(QtWidgets.QSlider.TicksBelow)
+    slider.sliderMoved.connect(print)
+    slider.show()
+    app.exec()
@@ -4,10 +4,15 @@ Created on May 4, 2020
 @author: Eddie
 """
 
-from typing import Optional
+from typing import Callable, Dict, Optional, Tuple
 
 from PyQt5 import QtWidgets, QtCore, QtGui
 
+try:
+    from .animation import can_animate, frame_interval
+except ImportError:  # Run as a script, not from the package
+    from animation import can_animate, frame_interval
+
 
 class ToggleSwitch(QtWidgets.QAbstractButton):
 
@@ -24,8 +29,12 @@ class ToggleSwitch(QtWidgets.QAbstractButton):
         self._trackRadius = track_radius
         self._thumbRadius = thumb_radius
 
-        # Set animation duration
+        # Set animation duration. The animation is created on the first
+        # toggle and released when it finishes. The frame clock caps the
+        # frame rate, if the animation policy asks for it.
         self._anim = 100
+        self._animation: Optional[QtCore.QVariantAnimation] = None
+        self._frameClock = QtCore.QElapsedTimer()
 
         # Define some parameters based on the sizes.
         self._margin = max(0, self._thumbRadius - self._trackRadius)
@@ -37,28 +46,7 @@ class ToggleSwitch(QtWidgets.QAbstractButton):
         self._offset = self._baseOffset
 
         # Define the look (colors and opacity) of the button
-        palette = self.palette()
-
-        if self._thumbRadius > self._trackRadius:
-            self._trackColor = {
-                True: palette.highlight(),
-                False: palette.dark(),
-            }
-            self._thumbColor = {
-                True: palette.highlight(),
-                False: palette.light(),
-            }
-            self._trackOpacity = 0.5
-        else:
-            self._thumbColor = {
-                True: palette.highlightedText(),
-                False: palette.light(),
-            }
-            self._trackColor = {
-                True: palette.highlight(),
-                False: palette.dark(),
-            }
-            self._trackOpacity = 1
+        self._update_colors()
 
         # Set the cursor for the button to be a pointing hand
         self.setCursor(QtCore.Qt.PointingHandCursor)
@@ -72,8 +60,8 @@ class ToggleSwitch(QtWidgets.QAbstractButton):
 
     @offset.setter
     def offset(self, value: int):
-        self._offset = value
-        self.update()
+        # Only repaint where the thumb was and where it is now.
+        self.update(self._move_thumb(value))
 
     def sizeHint(self) -> QtCore.QSize:
         """
@@ -99,6 +87,7 @@ class ToggleSwitch(QtWidgets.QAbstractButton):
             Whether the button is to be set to checked or unchecked.
         """
         super(ToggleSwitch, self).setChecked(checked)
+        self._stop_animation()
         self.offset = self._endOffset[checked]()
 
     def set_animation_duration(self, value: int):
@@ -133,52 +122,128 @@ class ToggleSwitch(QtWidgets.QAbstractButton):
             The event object.
         """
         super(ToggleSwitch, self).resizeEvent(event)
+        self._stop_animation()
         self.offset = self._endOffset[self.isChecked()]()
 
+    def changeEvent(self, event: QtCore.QEvent):
+        """
+        Update the colors when the palette or style changes.
+
+        Parameters
+        ----------
+        event:
+            The event object.
+        """
+        super(ToggleSwitch, self).changeEvent(event)
+        if event.type() in (QtCore.QEvent.PaletteChange,
+                            QtCore.QEvent.StyleChange):
+            self._update_colors()
+            self.update()
+
     def paintEvent(self, _):
         """
         Update the look of the button. Runs whenever the button changes.
-        """
 
-        # Create the painter object
+        The track and thumb are drawn from pixmaps shared by all the
+        switches that look the same, so painting is two blits.
+        """
         p = QtGui.QPainter(self)
-        p.setRenderHint(p.Antialiasing, True)
-        p.setPen(QtCore.Qt.NoPen)
-        track_opacity = self._trackOpacity
-        thumb_opacity = 1.0
+        p.drawPixmap(0, 0, self._track_pixmap())
+        # noinspection PyPropertyAccess
+        p.drawPixmap(
+            self.offset - self._thumbRadius - 1,
+            self._baseOffset - self._thumbRadius - 1,
+            self._thumb_pixmap(),
+        )
+
+    def _update_colors(self):
+        """
+        Set the colors of the track and thumb from the palette.
+        """
+        self._trackColor, self._thumbColor, self._trackOpacity = \
+            _switch_colors(self.palette(), self._trackRadius,
+                           self._thumbRadius)
+
+    def _look(self) -> Tuple[QtGui.QBrush, float, QtGui.QBrush]:
+        """
+        Get the brushes and opacity for the state of the button.
 
+        Returns
+        -------
+        Tuple[QtGui.QBrush, float, QtGui.QBrush]
+            The track brush, the track opacity and the thumb brush.
+        """
         # Change the look of the button based on if it's enabled or not.
         if self.isEnabled():
-            track_brush = self._trackColor[self.isChecked()]
-            thumb_brush = self._thumbColor[self.isChecked()]
-        else:
-            track_opacity *= 0.8
-            track_brush = self.palette().shadow()
-            thumb_brush = self.palette().mid()
-
-        # Draw the track
-        p.setBrush(track_brush)
-        p.setOpacity(track_opacity)
-        p.drawRoundedRect(
-            self._margin,
-            self._margin,
-            self.width() - 2 * self._margin,
-            self.height() - 2 * self._margin,
-            self._trackRadius,
-            self._trackRadius,
-        )
+            return (self._trackColor[self.isChecked()], self._trackOpacity,
+                    self._thumbColor[self.isChecked()])
+        return (self.palette().shadow(), self._trackOpacity * 0.8,
+                self.palette().mid())
 
-        # Draw the thumb
-        p.setBrush(thumb_brush)
-        p.setOpacity(thumb_opacity)
-        # noinspection PyPropertyAccess
-        p.drawEllipse(
-            self.offset - self._thumbRadius,
-            self._baseOffset - self._thumbRadius,
-            2 * self._thumbRadius,
-            2 * self._thumbRadius,
+    def _track_pixmap(self) -> QtGui.QPixmap:
+        """
+        Get the pixmap of the track, the size of the button.
+
+        Returns
+        -------
+        QtGui.QPixmap
+            The track, from the process-wide pixmap cache.
+        """
+        brush, opacity, _ = self._look()
+        return _track_pixmap(self.size(), self._margin, self._trackRadius,
+                             brush, opacity, self.isEnabled(),
+                             self.isChecked(), self.devicePixelRatioF())
+
+    def _thumb_pixmap(self) -> QtGui.QPixmap:
+        """
+        Get the pixmap of the thumb, with a pixel around it for the
+        antialiased edge.
+
+        Returns
+        -------
+        QtGui.QPixmap
+            The thumb, from the process-wide pixmap cache.
+        """
+        _, _, brush = self._look()
+        return _thumb_pixmap(self._thumbRadius, brush, self.isEnabled(),
+                             self.isChecked(), self.devicePixelRatioF())
+
+    def _thumb_rect(self) -> QtCore.QRect:
+        """
+        Get the rectangle the thumb is drawn in.
+
+        Returns
+        -------
+        QtCore.QRect
+            The rectangle of the thumb, with a pixel around it for the
+            antialiased edge.
+        """
+        return QtCore.QRect(
+            self._offset - self._thumbRadius - 1,
+            self._baseOffset - self._thumbRadius - 1,
+            2 * self._thumbRadius + 2,
+            2 * self._thumbRadius + 2,
         )
 
+    def _move_thumb(self, offset: int) -> QtCore.QRect:
+        """
+        Move the thumb without repainting.
+
+        Parameters
+        ----------
+        offset:
+            The new offset of the thumb.
+
+        Returns
+        -------
+        QtCore.QRect
+            The rectangle to repaint, covering where the thumb was and
+            where it is now.
+        """
+        old_rect = self._thumb_rect()
+        self._offset = offset
+        return old_rect.united(self._thumb_rect())
+
     def mouseReleaseEvent(self, event: QtGui.QMouseEvent):
         super(ToggleSwitch, self).mouseReleaseEvent(event)
         if event.button() == QtCore.Qt.LeftButton:
@@ -189,16 +254,261 @@ class ToggleSwitch(QtWidgets.QAbstractButton):
         if event.key() == QtCore.Qt.Key_Space:
             self._animate_toggle()
 
+    def hideEvent(self, event: QtGui.QHideEvent):
+        """
+        Jump to the end of the animation when the button is hidden.
+
+        Parameters
+        ----------
+        event:
+            The event object.
+        """
+        super(ToggleSwitch, self).hideEvent(event)
+        self._finish_animation()
+
     def _animate_toggle(self):
         """
         Animate the button when the toggle state is changed.
+
+        The same animation is retargeted if the button is toggled again
+        before it finishes, so it runs from where the thumb is now. If the
+        animation policy is instant, or the button can't be seen, the thumb
+        jumps to the end.
         """
-        anim = QtCore.QPropertyAnimation(self, b'offset', self)
-        anim.setDuration(self._anim)
+        if not can_animate(self):
+            self._finish_animation()
+            return
+
+        if self._animation is None:
+            self._animation = QtCore.QVariantAnimation(self)
+            self._animation.valueChanged.connect(self._on_animation_frame)
+            self._animation.finished.connect(self._release_animation)
+        else:
+            self._animation.stop()
+
+        self._frameClock.start()
+        self._animation.setDuration(self._anim)
         # noinspection PyPropertyAccess
-        anim.setStartValue(self.offset)
-        anim.setEndValue(self._endOffset[self.isChecked()]())
-        anim.start()
+        self._animation.setStartValue(self.offset)
+        self._animation.setEndValue(self._endOffset[self.isChecked()]())
+        self._animation.start()
+
+    def _on_animation_frame(self, value: int):
+        """
+        Move the thumb for a frame of the animation.
+
+        Frames closer together than the animation policy allows are
+        skipped, except the last.
+
+        Parameters
+        ----------
+        value:
+            The offset of the thumb.
+        """
+        if not can_animate(self):
+            self._finish_animation()
+            return
+
+        interval = frame_interval()
+        if (interval and value != self._animation.endValue()
+                and self._frameClock.elapsed() < interval):
+            return
+        self._frameClock.restart()
+        self.offset = value
+
+    def _finish_animation(self):
+        """
+        Stop the animation and move the thumb to the end.
+        """
+        self._stop_animation()
+        self._release_animation()
+        self.offset = self._endOffset[self.isChecked()]()
+
+    def _stop_animation(self):
+        """
+        Stop the animation of the thumb, if it's running.
+        """
+        if self._animation is not None:
+            self._animation.stop()
+
+    def _release_animation(self):
+        """
+        Delete the animation once it's finished.
+        """
+        if self._animation is not None:
+            self._animation.deleteLater()
+            self._animation = None
+
+
+def _switch_colors(palette: QtGui.QPalette, track_radius: int,
+                   thumb_radius: int
+                   ) -> Tuple[Dict[bool, QtGui.QBrush],
+                              Dict[bool, QtGui.QBrush], float]:
+    """
+    Get the colors of a toggle switch from a palette.
+
+    Parameters
+    ----------
+    palette:
+        The palette of the switch.
+    track_radius:
+        The radius of the track.
+    thumb_radius:
+        The radius of the thumb.
+
+    Returns
+    -------
+    Tuple[Dict[bool, QtGui.QBrush], Dict[bool, QtGui.QBrush], float]
+        The track and thumb brushes for unchecked and checked, and the
+        track opacity.
+    """
+    if thumb_radius > track_radius:
+        track_color = {
+            True: palette.highlight(),
+            False: palette.dark(),
+        }
+        thumb_color = {
+            True: palette.highlight(),
+            False: palette.light(),
+        }
+        track_opacity = 0.5
+    else:
+        thumb_color = {
+            True: palette.highlightedText(),
+            False: palette.light(),
+        }
+        track_color = {
+            True: palette.highlight(),
+            False: palette.dark(),
+        }
+        track_opacity = 1
+    return track_color, thumb_color, track_opacity
+
+
+def _track_pixmap(size: QtCore.QSize, margin: int, track_radius: int,
+                  brush: QtGui.QBrush, opacity: float, enabled: bool,
+                  checked: bool, dpr: float) -> QtGui.QPixmap:
+    """
+    Get the pixmap of the track of a toggle switch.
+
+    Parameters
+    ----------
+    size:
+        The size of the switch.
+    margin:
+        The margin around the track.
+    track_radius:
+        The radius of the track.
+    brush:
+        The brush of the track.
+    opacity:
+        The opacity of the track.
+    enabled:
+        Whether the switch is enabled.
+    checked:
+        Whether the switch is checked.
+    dpr:
+        The device pixel ratio to render at.
+
+    Returns
+    -------
+    QtGui.QPixmap
+        The track, from the process-wide pixmap cache.
+    """
+    key = 'ToggleSwitch.track:{}x{}:{}:{}:{:08x}:{}:{}:{}:{}'.format(
+        size.width(), size.height(), margin, track_radius,
+        brush.color().rgba(), opacity, enabled, checked, dpr,
+    )
+
+    pixmap = QtGui.QPixmapCache.find(key)
+    if pixmap is None:
+        def paint(p: QtGui.QPainter):
+            p.setBrush(brush)
+            p.setOpacity(opacity)
+            p.drawRoundedRect(
+                margin,
+                margin,
+                size.width() - 2 * margin,
+                size.height() - 2 * margin,
+                track_radius,
+                track_radius,
+            )
+
+        pixmap = _render_pixmap(size, dpr, paint)
+        QtGui.QPixmapCache.insert(key, pixmap)
+    return pixmap
+
+
+def _thumb_pixmap(thumb_radius: int, brush: QtGui.QBrush, enabled: bool,
+                  checked: bool, dpr: float) -> QtGui.QPixmap:
+    """
+    Get the pixmap of the thumb of a toggle switch, with a pixel around it
+    for the antialiased edge.
+
+    Parameters
+    ----------
+    thumb_radius:
+        The radius of the thumb.
+    brush:
+        The brush of the thumb.
+    enabled:
+        Whether the switch is enabled.
+    checked:
+        Whether the switch is checked.
+    dpr:
+        The device pixel ratio to render at.
+
+    Returns
+    -------
+    QtGui.QPixmap
+        The thumb, from the process-wide pixmap cache.
+    """
+    key = 'ToggleSwitch.thumb:{}:{:08x}:{}:{}:{}'.format(
+        thumb_radius, brush.color().rgba(), enabled, checked, dpr,
+    )
+
+    pixmap = QtGui.QPixmapCache.find(key)
+    if pixmap is None:
+        def paint(p: QtGui.QPainter):
+            p.setBrush(brush)
+            p.drawEllipse(1, 1, 2 * thumb_radius, 2 * thumb_radius)
+
+        size = 2 * thumb_radius + 2
+        pixmap = _render_pixmap(QtCore.QSize(size, size), dpr, paint)
+        QtGui.QPixmapCache.insert(key, pixmap)
+    return pixmap
+
+
+def _render_pixmap(size: QtCore.QSize, dpr: float,
+                   paint: Callable[[QtGui.QPainter], None]) -> QtGui.QPixmap:
+    """
+    Render a transparent pixmap at a device pixel ratio.
+
+    Parameters
+    ----------
+    size:
+        The size of the pixmap, in logical pixels.
+    dpr:
+        The device pixel ratio of the pixmap.
+    paint:
+        Paints the contents, in logical pixels, with an antialiased painter
+        with no pen.
+
+    Returns
+    -------
+    QtGui.QPixmap
+        The rendered pixmap.
+    """
+    pixmap = QtGui.QPixmap(size * dpr)
+    pixmap.setDevicePixelRatio(dpr)
+    pixmap.fill(QtCore.Qt.transparent)
+
+    p = QtGui.QPainter(pixmap)
+    p.setRenderHint(p.Antialiasing, True)
+    p.setPen(QtCore.Qt.NoPen)
+    paint(p)
+    p.end()
+    return pixmap
 
 
 if __name__ == '__main__':
@@ -0,0 +1,240 @@
+"""
+An item delegate that shows boolean cells as toggle switches.
+
+@author: Eddie
+"""
+
+from typing import Optional
+
+from PyQt5 import QtWidgets, QtCore, QtGui
+
+try:
+    from .toggle_switch import (ToggleSwitch, _switch_colors, _thumb_pixmap,
+                                _track_pixmap)
+except ImportError:  # Run as a script, not from the package
+    from toggle_switch import (ToggleSwitch, _switch_colors, _thumb_pixmap,
+                               _track_pixmap)
+
+
+class ToggleSwitchDelegate(QtWidgets.QStyledItemDelegate):
+    """Paint boolean cells of an item view as toggle switches.
+
+    The switches are painted from the same cached pixmaps as ToggleSwitch,
+    so they look the same, but there is no widget per cell and only the
+    visible cells are painted. Clicking a switch, or pressing space on the
+    current cell, toggles it through the model.
+
+    The checked state is read from the CheckStateRole if the model has it,
+    otherwise from the EditRole as a bool, and written back the same way.
+    Cells are toggled only if they're editable or user checkable.
+    """
+
+    def __init__(self, parent: Optional[QtCore.QObject] = None,
+                 track_radius: int = 8, thumb_radius: int = 11):
+        """Initialize the delegate.
+
+        Parameters
+        ----------
+        parent:
+            The parent QObject, usually the view.
+        track_radius:
+            The radius of the track of the switches.
+        thumb_radius:
+            The radius of the thumb of the switches.
+
+        """
+        super(ToggleSwitchDelegate, self).__init__(parent)
+
+        self._trackRadius = track_radius
+        self._thumbRadius = thumb_radius
+        self._margin = max(0, thumb_radius - track_radius)
+        self._baseOffset = max(thumb_radius, track_radius)
+
+    def paint(self, painter: QtGui.QPainter,
+              option: QtWidgets.QStyleOptionViewItem,
+              index: QtCore.QModelIndex):
+        """Paint the cell background and the switch.
+
+        Parameters
+        ----------
+        painter:
+            The painter of the view.
+        option:
+            The style of the cell.
+        index:
+            The index of the cell.
+
+        """
+        option = QtWidgets.QStyleOptionViewItem(option)
+        self.initStyleOption(option, index)
+
+        # Draw the selection and hover background, but no text or check
+        # box.
+        widget = option.widget
+        style = (widget.style() if widget is not None
+                 else QtWidgets.QApplication.style())
+        style.drawPrimitive(QtWidgets.QStyle.PE_PanelItemViewItem, option,
+                            painter, widget)
+
+        checked = self._is_checked(index)
+        enabled = bool(option.state & QtWidgets.QStyle.State_Enabled)
+
+        # Change the look of the switch based on if it's enabled or not.
+        palette = option.palette
+        track_color, thumb_color, track_opacity = _switch_colors(
+            palette, self._trackRadius, self._thumbRadius
+            )
+        if enabled:
+            track_brush = track_color[checked]
+            thumb_brush = thumb_color[checked]
+        else:
+            track_opacity *= 0.8
+            track_brush = palette.shadow()
+            thumb_brush = palette.mid()
+
+        rect = self._switch_rect(option)
+        dpr = painter.device().devicePixelRatioF()
+        offset = (rect.width() - self._baseOffset if checked
+                  else self._baseOffset)
+
+        painter.drawPixmap(rect.topLeft(), _track_pixmap(
+            rect.size(), self._margin, self._trackRadius, track_brush,
+            track_opacity, enabled, checked, dpr,
+            ))
+        painter.drawPixmap(
+            rect.left() + offset - self._thumbRadius - 1,
+            rect.top() + self._baseOffset - self._thumbRadius - 1,
+            _thumb_pixmap(self._thumbRadius, thumb_brush, enabled, checked,
+                          dpr),
+            )
+
+    def sizeHint(self, option: QtWidgets.QStyleOptionViewItem,
+                 index: QtCore.QModelIndex) -> QtCore.QSize:
+        """Get the size of the switch, with a margin.
+
+        Parameters
+        ----------
+        option:
+            The style of the cell.
+        index:
+            The index of the cell.
+
+        Returns
+        -------
+        QtCore.QSize
+            The size hint of the cell.
+
+        """
+        return self._switch_size() + QtCore.QSize(4, 4)
+
+    def createEditor(self, parent: QtWidgets.QWidget,
+                     option: QtWidgets.QStyleOptionViewItem,
+                     index: QtCore.QModelIndex) -> None:
+        """Don't create an editor, since the cell is toggled in place."""
+        return None
+
+    def editorEvent(self, event: QtCore.QEvent,
+                    model: QtCore.QAbstractItemModel,
+                    option: QtWidgets.QStyleOptionViewItem,
+                    index: QtCore.QModelIndex) -> bool:
+        """Toggle the cell when its switch is clicked or space is pressed.
+
+        Parameters
+        ----------
+        event:
+            The event object.
+        model:
+            The model of the cell.
+        option:
+            The style of the cell.
+        index:
+            The index of the cell.
+
+        Returns
+        -------
+        bool
+            Whether the event was handled.
+
+        """
+        flags = model.flags(index)
+        if (not flags & QtCore.Qt.ItemIsEnabled
+                or not flags & (QtCore.Qt.ItemIsEditable
+                                | QtCore.Qt.ItemIsUserCheckable)):
+            return False
+
+        if event.type() in (QtCore.QEvent.MouseButtonPress,
+                            QtCore.QEvent.MouseButtonRelease,
+                            QtCore.QEvent.MouseButtonDblClick):
+            if (event.button() != QtCore.Qt.LeftButton
+                    or not self._switch_rect(option).contains(event.pos())):
+                return False
+            # Toggle on release, and swallow the press and double click so
+            # the view doesn't start editing.
+            if event.type() != QtCore.QEvent.MouseButtonRelease:
+                return True
+        elif event.type() == QtCore.QEvent.KeyPress:
+            if event.key() not in (QtCore.Qt.Key_Space,
+                                   QtCore.Qt.Key_Select):
+                return False
+        else:
+            return False
+
+        return self._set_checked(model, index, not self._is_checked(index))
+
+    def _switch_size(self) -> QtCore.QSize:
+        """Get the size of a switch, the same as ToggleSwitch.sizeHint."""
+        return QtCore.QSize(
+            4 * self._trackRadius + 2 * self._margin,
+            2 * self._trackRadius + 2 * self._margin,
+        )
+
+    def _switch_rect(self, option: QtWidgets.QStyleOptionViewItem
+                     ) -> QtCore.QRect:
+        """Get the rectangle of the switch, centered in the cell."""
+        return QtWidgets.QStyle.alignedRect(
+            option.direction, QtCore.Qt.AlignCenter, self._switch_size(),
+            option.rect,
+        )
+
+    @staticmethod
+    def _is_checked(index: QtCore.QModelIndex) -> bool:
+        """Get whether a cell is checked."""
+        state = index.data(QtCore.Qt.CheckStateRole)
+        if state is not None:
+            return state == QtCore.Qt.Checked
+        return bool(index.data(QtCore.Qt.EditRole))
+
+    @staticmethod
+    def _set_checked(model: QtCore.QAbstractItemModel,
+                     index: QtCore.QModelIndex, checked: bool) -> bool:
+        """Set whether a cell is checked, in the role it was read from."""
+        if index.data(QtCore.Qt.CheckStateRole) is not None:
+            return model.setData(
+                index, QtCore.Qt.Checked if checked else QtCore.Qt.Unchecked,
+                QtCore.Qt.CheckStateRole,
+                )
+        return model.setData(index, checked, QtCore.Qt.EditRole)
+
+
+if __name__ == '__main__':
+    app = QtWidgets.QApplication.instance()
+    if app is None:
+        app = QtWidgets.QApplication([])
+
+    model = QtGui.QStandardItemModel(100000, 2)
+    for row in range(model.rowCount()):
+        model.setData(model.index(row, 0), 'Row {}'.format(row))
+        model.setData(model.index(row, 1), row % 3 == 0)
+
+    view = QtWidgets.QTableView()
+    view.setModel(model)
+    view.setItemDelegateForColumn(1, ToggleSwitchDelegate(view))
+    view.verticalHeader().setDefaultSectionSize(
+        ToggleSwitch().sizeHint().height() + 4
+        )
+    model.dataChanged.connect(
+        lambda index, *_: print(index.row(), index.data())
+        )
+    view.show()
+
+    app.exec()
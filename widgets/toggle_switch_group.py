@@ -0,0 +1,315 @@
+"""
+A group of toggle switches animated together from one timer.
+
+@author: Eddie
+"""
+
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from PyQt5 import QtWidgets, QtCore, QtGui, sip
+
+try:
+    from .animation import can_animate, frame_interval
+    from .toggle_switch import ToggleSwitch
+except ImportError:  # Run as a script, not from the package
+    from animation import can_animate, frame_interval
+    from toggle_switch import ToggleSwitch
+
+
+class ToggleSwitchGroup(QtCore.QObject):
+    """Toggle switches that are checked and animated in bulk.
+
+    Setting the checked state of many switches at once through the group
+    animates them all from a single timer. Each frame moves the thumbs of
+    all the animating switches, then repaints the union of their thumbs
+    once per window, rather than each switch running its own animation
+    and repainting itself.
+
+    The toggled signals of the switches aren't emitted for bulk changes.
+    Instead, the group emits one switches_toggled signal with all the
+    switches that changed.
+
+    Switches toggled one at a time, by clicking them, still animate
+    themselves.
+    """
+
+    #: Signal emitted with the switches whose checked state changed in a
+    #: bulk change.
+    switches_toggled = QtCore.pyqtSignal(list)
+
+    def __init__(self, parent: Optional[QtCore.QObject] = None,
+                 frame_rate: float = 60.0):
+        """Initialize the group, with no switches.
+
+        Parameters
+        ----------
+        parent:
+            The parent QObject, if any.
+        frame_rate:
+            The most frames per second the group animates at.
+
+        """
+        super(ToggleSwitchGroup, self).__init__(parent)
+
+        self._switches: List[ToggleSwitch] = []
+
+        # The start and end offsets of each animating switch, and the time
+        # the animation started.
+        self._animations: Dict[ToggleSwitch, Tuple[int, int]] = {}
+        self._clock = QtCore.QElapsedTimer()
+
+        self._timer = QtCore.QTimer(self)
+        self._timer.setTimerType(QtCore.Qt.PreciseTimer)
+        self._timer.timeout.connect(self._advance)
+        self.set_frame_rate(frame_rate)
+
+    def add_switch(self, switch: ToggleSwitch):
+        """Add a switch to the group.
+
+        Parameters
+        ----------
+        switch:
+            The switch to add.
+
+        """
+        if switch not in self._switches:
+            self._switches.append(switch)
+            switch.destroyed.connect(self._forget)
+
+    def remove_switch(self, switch: ToggleSwitch):
+        """Remove a switch from the group.
+
+        The switch jumps to the end of its animation, if it's animating.
+
+        Parameters
+        ----------
+        switch:
+            The switch to remove.
+
+        """
+        if switch in self._switches:
+            self._switches.remove(switch)
+            switch.destroyed.disconnect(self._forget)
+        if self._animations.pop(switch, None) is not None:
+            switch.offset = switch._endOffset[switch.isChecked()]()
+
+    def switches(self) -> List[ToggleSwitch]:
+        """Get the switches in the group.
+
+        Returns
+        -------
+        List[ToggleSwitch]
+            The switches, in the order they were added.
+
+        """
+        return list(self._switches)
+
+    def frame_rate(self) -> float:
+        """Get the most frames per second the group animates at.
+
+        The animation policy may cap it lower.
+
+        Returns
+        -------
+        float
+            The frame rate.
+
+        """
+        return self._frame_rate
+
+    def set_frame_rate(self, rate: float):
+        """Set the most frames per second the group animates at.
+
+        Parameters
+        ----------
+        rate:
+            The frame rate.
+
+        """
+        if rate <= 0:
+            raise ValueError('The frame rate must be positive.')
+        self._frame_rate = rate
+        self._timer.setInterval(self._frame_interval())
+
+    def is_animating(self) -> bool:
+        """Get whether any switches are animating.
+
+        Returns
+        -------
+        bool
+            Whether any switches are animating.
+
+        """
+        return bool(self._animations)
+
+    def set_checked(self, checked: bool,
+                    switches: Optional[Iterable[ToggleSwitch]] = None):
+        """Set the checked state of many switches at once.
+
+        The switches that change are animated together, and
+        switches_toggled is emitted once with them.
+
+        Parameters
+        ----------
+        checked:
+            Whether the switches are to be checked or unchecked.
+        switches:
+            The switches to set, which must be in the group. If not given,
+            all the switches in the group.
+
+        """
+        if switches is None:
+            switches = self._switches
+        self._set_states((switch, checked) for switch in switches)
+
+    def toggle(self, switches: Optional[Iterable[ToggleSwitch]] = None):
+        """Toggle the checked state of many switches at once.
+
+        The switches are animated together, and switches_toggled is
+        emitted once with them.
+
+        Parameters
+        ----------
+        switches:
+            The switches to toggle, which must be in the group. If not
+            given, all the switches in the group.
+
+        """
+        if switches is None:
+            switches = self._switches
+        self._set_states([(switch, not switch.isChecked())
+                          for switch in switches])
+
+    def _set_states(self, states: Iterable[Tuple[ToggleSwitch, bool]]):
+        """Set the checked state of switches and animate them together.
+
+        Parameters
+        ----------
+        states:
+            The switches and whether each is to be checked.
+
+        """
+        changed = []
+        for switch, checked in states:
+            if switch.isChecked() == checked:
+                continue
+
+            # Bypass ToggleSwitch.setChecked, which moves the thumb to the
+            # end at once.
+            blocked = switch.blockSignals(True)
+            QtWidgets.QAbstractButton.setChecked(switch, checked)
+            switch.blockSignals(blocked)
+
+            switch._stop_animation()
+            if can_animate(switch):
+                # noinspection PyPropertyAccess
+                self._animations[switch] = (switch.offset,
+                                            switch._endOffset[checked]())
+            else:
+                switch._move_thumb(switch._endOffset[checked]())
+            changed.append(switch)
+
+        if changed:
+            # Restart the animations already running from where they are,
+            # so they share the new start time.
+            # noinspection PyPropertyAccess
+            self._animations.update(
+                (switch, (switch.offset, end))
+                for switch, (_, end) in list(self._animations.items())
+                )
+            self._clock.start()
+            # Repaint the new colors of the tracks
+            self._repaint(changed)
+            if self._animations and not self._timer.isActive():
+                self._timer.start(self._frame_interval())
+            self.switches_toggled.emit(changed)
+
+    def _advance(self):
+        """Move the thumbs of the animating switches one frame on."""
+        elapsed = self._clock.elapsed()
+
+        dirty: Dict[QtWidgets.QWidget, QtGui.QRegion] = {}
+        for switch, (start, end) in list(self._animations.items()):
+            duration = switch.animation_duration()
+            if elapsed >= duration or not can_animate(switch):
+                offset = end
+                del self._animations[switch]
+            else:
+                offset = start + round((end - start) * elapsed / duration)
+
+            rect = switch._move_thumb(offset)
+            if switch.isVisible():
+                window = switch.window()
+                region = dirty.setdefault(window, QtGui.QRegion())
+                dirty[window] = region.united(QtCore.QRect(
+                    switch.mapTo(window, rect.topLeft()), rect.size()
+                    ))
+
+        for window, region in dirty.items():
+            window.update(region)
+
+        if not self._animations:
+            self._timer.stop()
+        elif self._timer.interval() != self._frame_interval():
+            self._timer.setInterval(self._frame_interval())
+
+    def _frame_interval(self) -> int:
+        """Get the time between frames, capped by the animation policy."""
+        return max(1, round(1000 / self._frame_rate), frame_interval())
+
+    def _repaint(self, switches: List[ToggleSwitch]):
+        """Repaint whole switches, once per window.
+
+        Parameters
+        ----------
+        switches:
+            The switches to repaint.
+
+        """
+        dirty: Dict[QtWidgets.QWidget, QtGui.QRegion] = {}
+        for switch in switches:
+            if switch.isVisible():
+                window = switch.window()
+                region = dirty.setdefault(window, QtGui.QRegion())
+                dirty[window] = region.united(QtCore.QRect(
+                    switch.mapTo(window, QtCore.QPoint()), switch.size()
+                    ))
+
+        for window, region in dirty.items():
+            window.update(region)
+
+    def _forget(self):
+        """Drop the switches that were deleted."""
+        self._switches = [s for s in self._switches if not sip.isdeleted(s)]
+        for switch in [s for s in self._animations if sip.isdeleted(s)]:
+            del self._animations[switch]
+
+
+if __name__ == '__main__':
+    app = QtWidgets.QApplication.instance()
+    if app is None:
+        app = QtWidgets.QApplication([])
+
+    group = ToggleSwitchGroup()
+    group.switches_toggled.connect(lambda changed: print(len(changed)))
+
+    grid = QtWidgets.QGridLayout()
+    for i in range(500):
+        toggle = ToggleSwitch()
+        group.add_switch(toggle)
+        grid.addWidget(toggle, i // 25, i % 25)
+
+    select_all = QtWidgets.QPushButton('Select all')
+    select_all.clicked.connect(lambda: group.set_checked(True))
+    select_none = QtWidgets.QPushButton('Select none')
+    select_none.clicked.connect(lambda: group.set_checked(False))
+
+    layout = QtWidgets.QVBoxLayout()
+    layout.addLayout(grid)
+    layout.addWidget(select_all)
+    layout.addWidget(select_none)
+    widget = QtWidgets.QWidget()
+    widget.setLayout(layout)
+    widget.show()
+
+    app.exec()
@@ -0,0 +1,189 @@
+"""
+Whole steps from the deltas of mouse wheels and touchpads.
+
+@author: Eddie
+"""
+
+from typing import Optional
+
+from PyQt5 import QtCore, QtGui
+
+try:
+    from .animation import frame_interval
+except ImportError:  # Run as a script, not from the package
+    from animation import frame_interval
+
+# The angle delta of one notch of a mouse wheel (eighths of a degree)
+_ANGLE_PER_STEP = 120
+# The pixel delta of one step, for devices that only report pixels
+_PIXELS_PER_STEP = 20
+# The shortest time between emissions of stepped (milliseconds)
+_FRAME_INTERVAL = 16
+# The time without steps that ends a spin of the wheel (milliseconds)
+_SPIN_TIMEOUT = 250
+# The speed that doubles the step, and each multiple of it adds one more
+# (steps per second)
+_ACCELERATION_SPEED = 20.0
+
+
+class WheelSteps(QtCore.QObject):
+    """Add up wheel deltas into whole steps, emitted once a frame.
+
+    Wheel deltas are added up into whole steps of a notch each, so
+    touchpads and smooth-scrolling mice, which send many small deltas per
+    notch, step as far as a notched wheel. The steps are emitted at most
+    once a frame, summed, so a burst of events makes one emission.
+    """
+
+    #: Signal emitted with the summed steps, negative for scrolling down.
+    stepped = QtCore.pyqtSignal(int)
+
+    def __init__(self, parent: Optional[QtCore.QObject] = None):
+        """Initialize the wheel steps, with no acceleration.
+
+        Parameters
+        ----------
+        parent:
+            The parent QObject, usually the widget scrolled.
+
+        """
+        super(WheelSteps, self).__init__(parent)
+
+        # The wheel delta that hasn't made a whole step yet, and the steps
+        # waiting to be emitted
+        self._angle_remainder = 0
+        self._pixel_remainder = 0
+        self._pending_steps = 0
+        self._emit_timer = QtCore.QTimer(self)
+        self._emit_timer.setSingleShot(True)
+        self._emit_timer.timeout.connect(self._emit_pending)
+
+        # The speed of the wheel, for acceleration
+        self._acceleration = False
+        self._speed = 0.0
+        self._spin_clock = QtCore.QElapsedTimer()
+
+    def acceleration(self) -> bool:
+        """Get whether fast spins of the wheel take bigger steps.
+
+        Returns
+        -------
+        bool
+            Whether the steps are accelerated.
+
+        """
+        return self._acceleration
+
+    def set_acceleration(self, acceleration: bool):
+        """Set whether fast spins of the wheel take bigger steps.
+
+        With acceleration, the steps are multiplied by one more for every
+        20 steps per second the wheel is spun.
+
+        Parameters
+        ----------
+        acceleration:
+            Whether the steps are accelerated.
+
+        """
+        self._acceleration = acceleration
+
+    def add_event(self, event: QtGui.QWheelEvent) -> bool:
+        """Add the delta of a wheel event.
+
+        The angle delta is used if there is one, otherwise the pixel delta.
+        Turning back the other way, or ending the scroll, drops the delta
+        that hasn't made a whole step.
+
+        Parameters
+        ----------
+        event:
+            The wheel event.
+
+        Returns
+        -------
+        bool
+            Whether the event had a vertical delta.
+
+        """
+        angle = event.angleDelta().y()
+        pixels = event.pixelDelta().y()
+
+        if angle:
+            self._angle_remainder = _accumulate(self._angle_remainder, angle)
+            steps = int(self._angle_remainder / _ANGLE_PER_STEP)
+            self._angle_remainder -= steps * _ANGLE_PER_STEP
+        else:
+            self._pixel_remainder = _accumulate(self._pixel_remainder,
+                                                pixels)
+            steps = int(self._pixel_remainder / _PIXELS_PER_STEP)
+            self._pixel_remainder -= steps * _PIXELS_PER_STEP
+
+        if event.phase() == QtCore.Qt.ScrollEnd:
+            self._angle_remainder = self._pixel_remainder = 0
+
+        if steps:
+            self._pending_steps += steps * self._step_multiplier(abs(steps))
+            if not self._emit_timer.isActive():
+                self._emit_pending()
+        return bool(angle or pixels)
+
+    def _step_multiplier(self, steps: int) -> int:
+        """
+        Measure the speed of the wheel and get the multiplier of the steps.
+
+        Parameters
+        ----------
+        steps:
+            The number of whole steps of the event.
+
+        Returns
+        -------
+        int
+            The multiplier, 1 without acceleration.
+        """
+        if not self._acceleration:
+            return 1
+
+        if not self._spin_clock.isValid():
+            elapsed = _SPIN_TIMEOUT
+        else:
+            elapsed = self._spin_clock.elapsed()
+        self._spin_clock.start()
+
+        # Smooth the speed, so one quick event doesn't jump the step.
+        if elapsed >= _SPIN_TIMEOUT:
+            self._speed = 0.0
+        else:
+            speed = steps * 1000 / max(elapsed, 1)
+            self._speed = (self._speed + speed) / 2
+        return 1 + int(self._speed / _ACCELERATION_SPEED)
+
+    def _emit_pending(self):
+        """Emit the steps waiting since the last frame, if there are any."""
+        if self._pending_steps:
+            steps, self._pending_steps = self._pending_steps, 0
+            self.stepped.emit(steps)
+            self._emit_timer.start(max(_FRAME_INTERVAL, frame_interval()))
+
+
+def _accumulate(remainder: int, delta: int) -> int:
+    """
+    Add a wheel delta to the remainder, dropping it if the direction
+    changed.
+
+    Parameters
+    ----------
+    remainder:
+        The delta that hasn't made a whole step yet.
+    delta:
+        The delta of the event.
+
+    Returns
+    -------
+    int
+        The new remainder.
+    """
+    if (remainder < 0) != (delta < 0):
+        remainder = 0
+    return remainder + delta